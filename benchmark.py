@@ -0,0 +1,209 @@
+"""
+Benchmark the dashboard's hot paths on synthetic Wyscout exports and write a
+JSON baseline that later runs can be compared against:
+
+    python benchmark.py [--players 10 100 1000] [--matches 30] [--out bench.json]
+    python benchmark.py --players 100 --compare bench.json
+
+Synthetic Player_stats_*.xlsx and season_overview.xlsx files are cloned from
+the bundled exports (same raw header layout, jittered numbers, weekly dates),
+so every stage runs exactly as it does on real data. Each stage is timed on
+its own, then re-run under tracemalloc for its peak Python allocation (memory
+held by parse worker processes is not included).
+"""
+import argparse
+import datetime
+import glob
+import json
+import os
+import platform
+import random
+import shutil
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+from openpyxl import Workbook, load_workbook
+
+import core
+from ingest import player_name_from_path
+
+TEMPLATE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+# ─────────────────────────────────────────────
+# SYNTHETIC DATA
+# ─────────────────────────────────────────────
+def _read_rows(path):
+    wb = load_workbook(path, read_only=True, data_only=True)
+    try:
+        return [list(row) for row in wb.worksheets[0].iter_rows(values_only=True)]
+    finally:
+        wb.close()
+
+
+def _write_rows(path, rows):
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet()
+    for row in rows:
+        ws.append(row)
+    wb.save(path)
+
+
+def _jitter(value, rng):
+    """A nearby value of the same type; text, dates and blanks are kept."""
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return value
+    if isinstance(value, int):
+        return max(0, value + rng.randint(-1, 1))
+    return round(max(0.0, value * rng.uniform(0.8, 1.2)), 2)
+
+
+def generate_dataset(folder, n_players, n_matches, seed=0):
+    """
+    Write n_players match exports of n_matches rows each, plus a season
+    overview listing them, into folder. Player i is cloned from bundled
+    export i modulo the number of bundled exports.
+    """
+    rng = random.Random(seed)
+    templates = sorted(glob.glob(os.path.join(TEMPLATE_DIR, "Player_stats_*.xlsx")))
+    if not templates:
+        raise SystemExit(f"no Player_stats_*.xlsx templates in {TEMPLATE_DIR}")
+    season_rows = _read_rows(os.path.join(TEMPLATE_DIR, core.SEASON_FILE))
+    season_by_name = {row[0]: row for row in season_rows[1:]}
+    template_rows = [_read_rows(path) for path in templates]
+    date_col = template_rows[0][0].index("Date")
+    first_date = datetime.date(2026, 5, 1)
+
+    season_out = [season_rows[0]]
+    for i in range(n_players):
+        name = f"S. Player{i:04d}"
+        rows = template_rows[i % len(templates)]
+        header, body = rows[0], rows[1:]
+        matches = [header]
+        for j in range(n_matches):
+            row = [_jitter(v, rng) for v in body[j % len(body)]]
+            row[date_col] = (first_date - datetime.timedelta(days=7 * j)).isoformat()
+            matches.append(row)
+        _write_rows(os.path.join(folder, f"Player_stats_S__Player{i:04d}.xlsx"), matches)
+
+        season_row = list(season_by_name.get(player_name_from_path(templates[i % len(templates)]), season_rows[1]))
+        season_row[0] = name
+        season_out.append(season_row)
+    _write_rows(os.path.join(folder, core.SEASON_FILE), season_out)
+
+
+# ─────────────────────────────────────────────
+# STAGES
+# ─────────────────────────────────────────────
+def rate_rows_scalar(match_df):
+    """The original per-row rating loop: calculate_performance_rating over iterrows()."""
+    ratings = []
+    for _, row in match_df.iterrows():
+        mins = core.safe_float(row.get("Minutes played", 0))
+        pos_group = core.get_position_group(row.get("Position", ""))
+        ratings.append(core.calculate_performance_rating(row, pos_group, mins))
+    return ratings
+
+
+def render_all_game_logs(season_df, match_df):
+    """Game-log HTML for every client, as the profile tab builds it."""
+    frames = core.build_player_frames(match_df, core.build_player_index(season_df, match_df))
+    positions = dict(zip(season_df["Player"], season_df["Position"].astype(str)))
+    return sum(len(core.render_game_log(frame, "GK" in positions.get(name, ""))) for name, frame in frames.items())
+
+
+def measure(fn, setup=None):
+    """(seconds, peak MB, result) of fn(), each measurement after a fresh setup()."""
+    if setup:
+        setup()
+    start = time.perf_counter()
+    result = fn()
+    seconds = time.perf_counter() - start
+    if setup:
+        setup()
+    tracemalloc.start()
+    try:
+        fn()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return seconds, peak / 2**20, result
+
+
+def run_scale(n_players, n_matches, workers):
+    """Generate one dataset and return the timings of every stage on it."""
+    folder = tempfile.mkdtemp(prefix=f"bench_{n_players}_")
+    cwd = os.getcwd()
+    try:
+        generate_dataset(folder, n_players, n_matches)
+        os.chdir(folder)  # core reads its files relative to the working directory
+        core.INGEST_WORKERS = workers
+
+        def clear_cache():
+            shutil.rmtree(core.CACHE_DIR, ignore_errors=True)
+
+        rows = n_players * n_matches
+        stages = {}
+
+        def record(stage, n, fn, setup=None):
+            seconds, peak_mb, result = measure(fn, setup)
+            stages[stage] = {
+                "seconds": round(seconds, 4),
+                "rows_per_s": round(n / seconds, 1) if seconds else None,
+                "peak_mb": round(peak_mb, 2),
+            }
+            return result
+
+        season = record("load_season_data", n_players, core.load_season_data, clear_cache)
+        record("load_match_data (cold)", rows, core.load_match_data, clear_cache)
+        matches = record("load_match_data (warm)", rows, core.load_match_data)
+        record("calculate_performance_rating loop", rows, lambda: rate_rows_scalar(matches))
+        record("calculate_performance_ratings", rows, lambda: core.calculate_performance_ratings(matches))
+        record("render_game_log (all clients)", rows, lambda: render_all_game_logs(season, matches))
+        return {"players": n_players, "matches_per_player": n_matches, "rows": rows, "stages": stages}
+    finally:
+        os.chdir(cwd)
+        shutil.rmtree(folder, ignore_errors=True)
+
+
+def compare(results, baseline):
+    """Print each stage's speed relative to a previous run (>1 is faster now)."""
+    previous = {(s["players"], s["matches_per_player"]): s["stages"] for s in baseline["scales"]}
+    for scale in results["scales"]:
+        old = previous.get((scale["players"], scale["matches_per_player"]))
+        if old is None:
+            continue
+        print(f"\n{scale['players']} players x {scale['matches_per_player']} matches")
+        for stage, now in scale["stages"].items():
+            if stage in old and now["seconds"]:
+                print(f"  {stage:<36} {old[stage]['seconds'] / now['seconds']:6.2f}x  "
+                      f"peak {old[stage]['peak_mb']:.1f} -> {now['peak_mb']:.1f} MB")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark load, rating and render on synthetic exports.")
+    parser.add_argument("--players", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--matches", type=int, default=30, help="matches per player")
+    parser.add_argument("--workers", type=int, default=1, help="processes used to parse the exports")
+    parser.add_argument("--out", help="write the JSON results here (default: stdout)")
+    parser.add_argument("--compare", help="previous JSON results to compare against")
+    args = parser.parse_args()
+
+    results = {
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "numpy": np.__version__,
+        "workers": args.workers,
+        "scales": [run_scale(n, args.matches, args.workers) for n in args.players],
+    }
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as fh:
+            json.dump(results, fh, indent=2)
+    else:
+        print(json.dumps(results, indent=2))
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as fh:
+            compare(results, json.load(fh))
@@ -0,0 +1,90 @@
+"""
+Compact in-memory layout for the combined match frame, and a before/after
+memory report. Run directly to print the report for a folder of exports:
+
+    python compact.py [folder] [--sparse 0.9]
+"""
+import argparse
+import glob
+import os
+
+import numpy as np
+import pandas as pd
+
+from ingest import apply_schema_dtypes, column_kind, ingest_match_files
+
+# String columns repeated across match rows
+CATEGORICAL_COLUMNS = ["Player", "Match", "Competition", "Position"]
+# Only convert when values repeat enough for the codes to pay off
+MAX_UNIQUE_SHARE = 0.5
+
+
+def _downcast_count(series):
+    """Nullable int16 counts that fit in int8 become Int8."""
+    if str(series.dtype) != "Int16":
+        return series
+    present = series.dropna()
+    if present.empty or present.abs().max() <= np.iinfo(np.int8).max:
+        return series.astype("Int8")
+    return series
+
+
+def _zero_share(series):
+    return float((series == 0).mean()) if len(series) else 0.0
+
+
+def compact_match_frame(df, sparse_zero_share=None):
+    """
+    Return a compact copy of a match frame: categoricals for repeated
+    strings and int8 for small counts. With sparse_zero_share set, count
+    columns without gaps whose share of zeros is at least that value (e.g.
+    Red cards, Exits) are stored as sparse arrays with 0 as the fill value.
+    """
+    out = df.copy()
+    for col in out.columns:
+        series = out[col]
+        if col in CATEGORICAL_COLUMNS:
+            if (not isinstance(series.dtype, pd.CategoricalDtype)
+                    and series.nunique() <= MAX_UNIQUE_SHARE * len(series)):
+                out[col] = series.astype("category")
+            continue
+        if column_kind(col) != "count" or col == "Rating":
+            continue
+        series = _downcast_count(series)
+        if (sparse_zero_share is not None and series.notna().all()
+                and _zero_share(series) >= sparse_zero_share):
+            numpy_dtype = np.dtype(str(series.dtype).lower())
+            series = series.astype(numpy_dtype).astype(pd.SparseDtype(numpy_dtype, 0))
+        out[col] = series
+    return out
+
+
+def memory_report(before, after):
+    """Per-column deep memory use of two layouts of a frame, biggest savings first, with a TOTAL row."""
+    report = pd.DataFrame({
+        "before": before.memory_usage(deep=True, index=False),
+        "after": after.memory_usage(deep=True, index=False),
+    }).fillna(0).astype("int64")
+    report["saved"] = report["before"] - report["after"]
+    report = report.sort_values("saved", ascending=False)
+    report.loc["TOTAL"] = report.sum()
+    return report
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Memory report for the compact match layout.")
+    parser.add_argument("folder", nargs="?", default="./")
+    parser.add_argument("--sparse", type=float, default=None,
+                        help="store count columns with at least this share of zeros as sparse")
+    args = parser.parse_args()
+
+    files = sorted(glob.glob(os.path.join(args.folder, "Player_stats_*.xlsx")))
+    frames = ingest_match_files(files, os.path.join(args.folder, ".xlsx_cache"))
+    combined = apply_schema_dtypes(pd.concat(frames, ignore_index=True)) if frames else pd.DataFrame()
+    compact = compact_match_frame(combined, args.sparse)
+    report = memory_report(combined, compact)
+    print(report.to_string())
+    total = report.loc["TOTAL"]
+    if total["before"]:
+        print(f"\n{len(combined)} rows: {total['before'] / 1024:.1f} KB -> {total['after'] / 1024:.1f} KB "
+              f"({100 * total['after'] / total['before']:.0f}%)")
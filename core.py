@@ -0,0 +1,770 @@
+"""
+Shared data and rating core for every branded dashboard variant: loading the
+Wyscout exports, the position-weighted rating model and game-log rendering.
+
+All caches live here (st.cache_resource / st.cache_data are keyed on this
+module), so one server process holds one dataset and one ratings cache no
+matter which theme a page is drawn with.
+"""
+import glob
+import json
+import logging
+import os
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from compact import compact_match_frame
+from instrument import cache_lookup, stage, timed, track_misses
+from profiles import PROFILES_FILE, ProfileError, load_profiles, rating_features, stat_values
+from ingest import (
+    apply_schema_dtypes, available_cpus, drop_cached, export_columns, file_fingerprint,
+    ingest_match_files, missing_columns, player_id, player_name_from_path, read_xlsx_cached,
+)
+from watcher import DataWatcher
+
+logger = logging.getLogger(__name__)
+
+# ─────────────────────────────────────────────
+# CONFIG
+# ─────────────────────────────────────────────
+SEASON_FILE = "season_overview.xlsx"
+MATCH_FOLDER = "./"
+CACHE_DIR = os.path.join(MATCH_FOLDER, ".xlsx_cache")
+MATCH_MANIFEST = os.path.join(CACHE_DIR, "match_manifest.json")
+MATCH_COMBINED_CACHE = os.path.join(CACHE_DIR, "match_data.parquet")
+# Rated, sorted and compacted match_df plus rating-input gaps, written by warmup.py or the first load
+PREPARED_MATCH_CACHE = os.path.join(CACHE_DIR, "prepared_matches.parquet")
+PREPARED_MATCH_META = os.path.join(CACHE_DIR, "prepared_matches.json")
+# Processes used to parse new or changed exports (1 = serial); by default the
+# CPUs this process may use, capped so a small replica doesn't start dozens
+INGEST_WORKERS = int(os.environ.get("INGEST_WORKERS", min(available_cpus(), 4)))
+# Seconds between checks of SEASON_FILE and the match exports for changes
+WATCH_INTERVAL = float(os.environ.get("WATCH_INTERVAL", 30))
+# Clients whose rendered game log is kept in memory (least recently used evicted)
+FRAGMENT_CACHE_SIZE = int(os.environ.get("FRAGMENT_CACHE_SIZE", 64))
+# Compact match_df layout (categoricals, int8 counts); see compact.py for a memory report
+COMPACT_MATCH_DATA = os.environ.get("COMPACT_MATCH_DATA", "1") != "0"
+# Rating weight profiles, and the one the dashboard rates with (see profiles.py)
+RATING_PROFILES_FILE = os.environ.get("RATING_PROFILES_FILE", PROFILES_FILE)
+RATING_PROFILE = os.environ.get("RATING_PROFILE", "default")
+# Share of zeros at which a count column is stored sparse, e.g. 0.9 (unset = dense)
+SPARSE_ZERO_SHARE = float(os.environ["SPARSE_ZERO_SHARE"]) if os.environ.get("SPARSE_ZERO_SHARE") else None
+
+
+# ─────────────────────────────────────────────
+# POSITION-WEIGHTED PERFORMANCE RATING
+# ─────────────────────────────────────────────
+# Substrings that put a position in a group, checked in this order (first match wins)
+POSITION_GROUP_RULES = [
+    ("gk", ["GK"]),
+    ("cb", ["CB", "LCB", "RCB"]),
+    ("fb", ["RB", "LB", "RWB", "LWB", "WB"]),
+    ("forward", ["CF", "ST", "LW", "RW", "RWF", "LWF"]),
+    ("mid", ["MF", "CM", "DM", "AM", "RCMF", "LCMF", "RDMF", "LDMF", "RAMF", "LAMF", "CAM", "CDM"]),
+]
+
+
+@lru_cache(maxsize=None)
+def _classify_position(pos):
+    """Group of one position string; Wyscout uses a few dozen, so each is scanned once."""
+    pos = pos.upper()
+    for group, codes in POSITION_GROUP_RULES:
+        if any(p in pos for p in codes):
+            return group
+    return "outfield"
+
+
+def get_position_group(position):
+    """Map Wyscout positions to a simplified group."""
+    if pd.isna(position) or position is None:
+        return "outfield"
+    return _classify_position(str(position))
+
+
+def position_groups(positions):
+    """
+    get_position_group over a whole Position column: each distinct value (or
+    category) is classified once and the groups are gathered by code.
+    Returns an object array aligned to positions.
+    """
+    if isinstance(positions.dtype, pd.CategoricalDtype):
+        codes, uniques = positions.cat.codes.to_numpy(), positions.cat.categories
+    else:
+        codes, uniques = pd.factorize(positions, use_na_sentinel=True)
+    table = np.array([get_position_group(p) for p in uniques] + ["outfield"], dtype=object)
+    return table[codes]  # code -1 (missing) picks the trailing "outfield"
+
+
+def safe_pct(numerator, denominator):
+    """Safely compute a percentage."""
+    try:
+        n = float(numerator) if pd.notna(numerator) else 0
+        d = float(denominator) if pd.notna(denominator) else 0
+        if d == 0:
+            return 0
+        return (n / d) * 100
+    except (ValueError, TypeError):
+        return 0
+
+
+def safe_float(val):
+    """Safely convert to float."""
+    try:
+        if pd.notna(val):
+            return float(val)
+    except (ValueError, TypeError):
+        pass
+    return 0.0
+
+
+def calculate_performance_rating(row, pos_group, minutes):
+    """
+    Calculate a 1-10 performance rating weighted by position.
+    Returns a float score.
+    """
+    if minutes < 10:
+        return None  # Too few minutes to rate
+
+    # Normalise to per-90 basis
+    factor = 90.0 / max(minutes, 1)
+
+    # Common stats (per 90)
+    goals_p90 = safe_float(row.get("Goals", 0)) * factor
+    assists_p90 = safe_float(row.get("Assists", 0)) * factor
+    xg_p90 = safe_float(row.get("xG", 0)) * factor
+    xa_p90 = safe_float(row.get("xA", 0)) * factor
+    shot_assists_p90 = safe_float(row.get("Shot assists", 0)) * factor
+
+    duels = safe_float(row.get("Duels", 0))
+    duels_won = safe_float(row.get("Duels_won", 0))
+    duel_pct = safe_pct(duels_won, duels) if duels > 0 else 50
+
+    passes = safe_float(row.get("Passes", 0))
+    passes_acc = safe_float(row.get("Passes_accurate", 0))
+    pass_pct = safe_pct(passes_acc, passes) if passes > 0 else 50
+
+    interceptions_p90 = safe_float(row.get("Interceptions", 0)) * factor
+    recoveries_p90 = safe_float(row.get("Recoveries", 0)) * factor
+    clearances_p90 = safe_float(row.get("Clearances", 0)) * factor
+
+    aerial = safe_float(row.get("Aerial duels", 0))
+    aerial_won = safe_float(row.get("Aerial duels_won", 0))
+    aerial_pct = safe_pct(aerial_won, aerial) if aerial > 0 else 50
+
+    dribbles = safe_float(row.get("Dribbles", 0))
+    dribbles_succ = safe_float(row.get("Dribbles_successful", 0))
+    dribble_pct = safe_pct(dribbles_succ, dribbles) if dribbles > 0 else 50
+
+    crosses = safe_float(row.get("Crosses", 0))
+    crosses_acc = safe_float(row.get("Crosses_accurate", 0))
+    cross_pct = safe_pct(crosses_acc, crosses) if crosses > 0 else 50
+
+    progressive_runs_p90 = safe_float(row.get("Progressive runs", 0)) * factor
+    touches_box_p90 = safe_float(row.get("Touches in penalty area", 0)) * factor
+
+    shots = safe_float(row.get("Shots", 0))
+    shots_on_target = safe_float(row.get("Shots_on target", 0))
+    shot_accuracy = safe_pct(shots_on_target, shots) if shots > 0 else 50
+
+    losses_p90 = safe_float(row.get("Losses", 0)) * factor
+    fouls_p90 = safe_float(row.get("Fouls", 0)) * factor
+    yellow = safe_float(row.get("Yellow cards", 0))
+    red = safe_float(row.get("Red cards", 0))
+
+    # Action success rate
+    total_actions = safe_float(row.get("Total actions", 0))
+    total_actions_succ = safe_float(row.get("Total actions_successful", 0))
+    action_pct = safe_pct(total_actions_succ, total_actions) if total_actions > 0 else 50
+
+    # GK specific
+    saves = safe_float(row.get("Saves", 0))
+    shots_against = safe_float(row.get("Shots against", 0))
+    save_pct = safe_pct(saves, shots_against) if shots_against > 0 else 70
+    conceded = safe_float(row.get("Conceded goals", 0))
+    xcg = safe_float(row.get("xCG", 0))
+    exits_p90 = safe_float(row.get("Exits", 0)) * factor
+
+    # Defensive duels
+    def_duels = safe_float(row.get("Defensive duels", 0))
+    def_duels_won = safe_float(row.get("Defensive duels_won", 0))
+    def_duel_pct = safe_pct(def_duels_won, def_duels) if def_duels > 0 else 50
+
+    # Discipline penalty
+    discipline_penalty = (yellow * 0.5) + (red * 2.0)
+
+    score = 5.0  # Start at average
+
+    if pos_group == "gk":
+        # GK: saves, goals prevented, distribution, commanding area
+        if shots_against > 0:
+            save_score = min((save_pct / 100) * 4, 4)  # up to +4
+        else:
+            save_score = 2.0  # untested = average
+        goals_prevented = xcg - conceded  # positive = good
+        prevention_score = min(max(goals_prevented * 1.5, -2), 2)  # -2 to +2
+        dist_score = min((pass_pct / 100) * 1.5, 1.5)  # up to +1.5
+        command_score = min(exits_p90 * 0.3, 0.5)  # up to +0.5
+
+        score = 4.0 + save_score + prevention_score + dist_score + command_score
+        score -= discipline_penalty
+
+    elif pos_group == "cb":
+        # CB: duels, aerials, interceptions, clearances, passing, discipline
+        duel_score = min((duel_pct / 100) * 2.5, 2.5)
+        aerial_score = min((aerial_pct / 100) * 1.5, 1.5)
+        def_actions = min((interceptions_p90 + clearances_p90 + recoveries_p90) * 0.2, 1.5)
+        pass_score = min((pass_pct / 100) * 1.5, 1.5)
+        loss_penalty = min(losses_p90 * 0.15, 1.0)
+        goal_bonus = goals_p90 * 3  # rare but valuable
+        assist_bonus = assists_p90 * 2
+
+        score = 3.5 + duel_score + aerial_score + def_actions + pass_score - loss_penalty + goal_bonus + assist_bonus
+        score -= discipline_penalty
+
+    elif pos_group == "fb":
+        # Fullback/Wingback: crosses, progressive runs, duels, tackles, passing
+        duel_score = min((duel_pct / 100) * 1.5, 1.5)
+        cross_score = min(cross_pct / 100 * 1.0 + crosses * factor * 0.2, 1.5)
+        prog_score = min(progressive_runs_p90 * 0.4, 1.5)
+        pass_score = min((pass_pct / 100) * 1.5, 1.5)
+        def_score = min((interceptions_p90 + recoveries_p90) * 0.2, 1.0)
+        loss_penalty = min(losses_p90 * 0.1, 0.8)
+        goal_bonus = goals_p90 * 3
+        assist_bonus = assists_p90 * 2.5
+
+        score = 3.5 + duel_score + cross_score + prog_score + pass_score + def_score - loss_penalty + goal_bonus + assist_bonus
+        score -= discipline_penalty
+
+    elif pos_group == "mid":
+        # Midfielder: pass accuracy, key passes, progressive play, duels, goals/assists
+        pass_score = min((pass_pct / 100) * 2.0, 2.0)
+        creation_score = min((shot_assists_p90 + xa_p90) * 1.5, 2.0)
+        duel_score = min((duel_pct / 100) * 1.5, 1.5)
+        prog_score = min(progressive_runs_p90 * 0.3, 1.0)
+        recovery_score = min(recoveries_p90 * 0.15, 0.8)
+        loss_penalty = min(losses_p90 * 0.1, 0.8)
+        goal_bonus = goals_p90 * 2.5
+        assist_bonus = assists_p90 * 2.5
+
+        score = 3.5 + pass_score + creation_score + duel_score + prog_score + recovery_score - loss_penalty + goal_bonus + assist_bonus
+        score -= discipline_penalty
+
+    elif pos_group == "forward":
+        # Forward/Winger: goals, xG, shots, dribbles, assists, touches in box
+        goal_score = min(goals_p90 * 3.0, 3.0)
+        xg_score = min(xg_p90 * 2.0, 2.0)
+        shot_score = min(shot_accuracy / 100 * 1.0 + shots * factor * 0.15, 1.5)
+        dribble_score = min(dribble_pct / 100 * 0.8 + dribbles_succ * factor * 0.2, 1.0)
+        creation_score = min((assists_p90 * 2.5 + xa_p90 * 1.5 + shot_assists_p90 * 0.5), 2.0)
+        box_presence = min(touches_box_p90 * 0.2, 0.8)
+        loss_penalty = min(losses_p90 * 0.05, 0.5)
+
+        score = 3.0 + goal_score + xg_score + shot_score + dribble_score + creation_score + box_presence - loss_penalty
+        score -= discipline_penalty
+
+    else:
+        # Generic outfield
+        action_score = min((action_pct / 100) * 3, 3)
+        duel_score = min((duel_pct / 100) * 2, 2)
+        goal_bonus = goals_p90 * 2.5
+        assist_bonus = assists_p90 * 2
+        score = 3.5 + action_score + duel_score + goal_bonus + assist_bonus
+        score -= discipline_penalty
+
+    # Clamp to 1-10
+    score = max(1.0, min(10.0, score))
+
+    # Minutes adjustment: if played less than 45 mins, slightly regress towards average
+    if minutes < 45:
+        weight = minutes / 45.0
+        score = score * weight + 5.0 * (1 - weight)
+
+    return round(score, 1)
+
+
+# Match columns read by the rating model; a missing column counts as 0
+RATING_COLUMNS = [
+    "Minutes played", "Position", "Goals", "Assists", "xG", "xA", "Shot assists",
+    "Duels", "Duels_won", "Passes", "Passes_accurate", "Interceptions", "Recoveries",
+    "Clearances", "Aerial duels", "Aerial duels_won", "Dribbles", "Dribbles_successful",
+    "Crosses", "Crosses_accurate", "Progressive runs", "Touches in penalty area",
+    "Shots", "Shots_on target", "Losses", "Yellow cards", "Red cards",
+    "Total actions", "Total actions_successful", "Saves", "Shots against",
+    "Conceded goals", "xCG", "Exits",
+]
+
+
+@lru_cache(maxsize=4)
+def _compiled_profiles(path, fingerprint):
+    return load_profiles(path)
+
+
+def rating_profiles():
+    """Every profile in RATING_PROFILES_FILE, compiled; recompiled whenever the file changes."""
+    return _compiled_profiles(RATING_PROFILES_FILE, file_fingerprint(RATING_PROFILES_FILE))
+
+
+def active_rating_profile():
+    profiles = rating_profiles()
+    if RATING_PROFILE not in profiles:
+        raise ProfileError(f"RATING_PROFILE {RATING_PROFILE!r} is not in {RATING_PROFILES_FILE}")
+    return profiles[RATING_PROFILE]
+
+
+@timed("calculate_performance_ratings")
+def calculate_performance_ratings(match_df, profile=None):
+    """
+    Batch version of calculate_performance_rating over a whole match frame,
+    evaluated with a compiled weight profile (default: RATING_PROFILE).
+    Returns a float Series named "Rating" aligned to match_df (NaN = not rated).
+    """
+    if match_df.empty:
+        return pd.Series(dtype=float, index=match_df.index, name="Rating")
+    profile = profile or active_rating_profile()
+    if "Position" in match_df.columns:
+        groups = position_groups(match_df["Position"])
+    else:
+        groups = np.full(len(match_df), "outfield")
+    ratings = profile.evaluate(rating_features(match_df), groups)
+    return pd.Series(ratings, index=match_df.index, name="Rating", dtype=float)
+
+
+def rating_to_html(rating):
+    """Convert a rating to a coloured HTML badge."""
+    if rating is None:
+        return '<span class="rating-minimal">—</span>'
+    if rating >= 8.0:
+        css = "rating-excellent"
+    elif rating >= 6.5:
+        css = "rating-good"
+    elif rating >= 5.0:
+        css = "rating-average"
+    elif rating >= 3.5:
+        css = "rating-belowavg"
+    else:
+        css = "rating-poor"
+    return f'<span class="{css}">{rating}</span>'
+
+
+def rating_label(rating):
+    """Get a text label for a rating."""
+    if rating is None:
+        return "N/A"
+    if rating >= 8.0:
+        return "Excellent"
+    elif rating >= 6.5:
+        return "Good"
+    elif rating >= 5.0:
+        return "Average"
+    elif rating >= 3.5:
+        return "Below Avg"
+    else:
+        return "Poor"
+
+
+# ─────────────────────────────────────────────
+# GAME LOG RENDERING
+# ─────────────────────────────────────────────
+GK_LOG_COLUMNS = ["Date", "Match", "Mins", "Rating", "Conceded", "xCG", "Saves", "Save%", "Passes", "Pass%", "Exits"]
+OUTFIELD_LOG_COLUMNS = ["Date", "Match", "Pos", "Mins", "Rating", "G", "A", "xG", "Shots", "Passes", "Pass%", "Duels", "Duel%", "Int"]
+
+
+def _text(df, col, default=""):
+    """A column as display strings (str() of each value, like the per-row code)."""
+    if col not in df.columns:
+        return [default] * len(df)
+    return [str(v) for v in df[col].astype(object).tolist()]
+
+
+def _ints(values):
+    return [str(v) for v in values.astype(int).tolist()]
+
+
+def _fixed(values, spec):
+    return [format(v, spec) for v in values.tolist()]
+
+
+def _pct_text(numerator, denominator):
+    """safe_pct as "NN%", or "—" where the denominator is 0."""
+    pct = np.divide(numerator, denominator, out=np.zeros_like(numerator), where=denominator > 0) * 100
+    return [f"{p:.0f}%" if d > 0 else "—" for p, d in zip(pct.tolist(), denominator.tolist())]
+
+
+def _rating_badges(ratings):
+    """rating_to_html for a whole column, formatting each distinct rating once."""
+    values = [None if pd.isna(r) else r for r in ratings.tolist()]
+    badges = {r: rating_to_html(r) for r in set(values)}
+    return [badges[r] for r in values]
+
+
+@timed("render_game_log")
+def render_game_log(player_matches, is_gk):
+    """
+    Build the game-log-table HTML for one player, formatting each column in
+    one go and joining all rows in a single pass. Unrated appearances (under
+    10 minutes) show the "—" badge.
+    """
+    def stat(col):
+        return stat_values(player_matches, col)
+
+    if "Date" in player_matches.columns:
+        dates = player_matches["Date"].dt.strftime("%d %b %Y").fillna("").tolist()
+    else:
+        dates = [""] * len(player_matches)
+    matches = [m[:45] for m in _text(player_matches, "Match")]
+    ratings = _rating_badges(player_matches["Rating"]) if "Rating" in player_matches.columns else [rating_to_html(None)] * len(player_matches)
+    mins = _ints(stat("Minutes played"))
+    passes = np.trunc(stat("Passes"))
+
+    if is_gk:
+        saves = np.trunc(stat("Saves"))
+        cells = [
+            ("", dates), (' class="match-col"', matches), (' class="num-col"', mins),
+            (' class="rating-col"', ratings),
+            (' class="num-col"', _ints(stat("Conceded goals"))),
+            (' class="num-col"', _fixed(stat("xCG"), ".2f")),
+            (' class="num-col"', _ints(saves)),
+            (' class="num-col"', _pct_text(saves, stat("Shots against"))),
+            (' class="num-col"', _ints(passes)),
+            (' class="num-col"', _pct_text(stat("Passes_accurate"), passes)),
+            (' class="num-col"', _ints(stat("Exits"))),
+        ]
+        header_cols = GK_LOG_COLUMNS
+    else:
+        duels = np.trunc(stat("Duels"))
+        cells = [
+            ("", dates), (' class="match-col"', matches), ("", _text(player_matches, "Position")),
+            (' class="num-col"', mins), (' class="rating-col"', ratings),
+            (' class="num-col"', _ints(stat("Goals"))),
+            (' class="num-col"', _ints(stat("Assists"))),
+            (' class="num-col"', _fixed(stat("xG"), ".2f")),
+            (' class="num-col"', _ints(stat("Shots"))),
+            (' class="num-col"', _ints(passes)),
+            (' class="num-col"', _pct_text(stat("Passes_accurate"), passes)),
+            (' class="num-col"', _ints(duels)),
+            (' class="num-col"', _pct_text(stat("Duels_won"), duels)),
+            (' class="num-col"', _ints(stat("Interceptions"))),
+        ]
+        header_cols = OUTFIELD_LOG_COLUMNS
+
+    # Wrap every column's values in its <td> once, then stitch rows together
+    columns = [[f"<td{attrs}>{v}</td>" for v in values] for attrs, values in cells]
+    body = "".join("<tr>" + "".join(row) + "</tr>" for row in zip(*columns))
+    head = "".join(f"<th>{col}</th>" for col in header_cols)
+    return f'<table class="game-log-table"><thead><tr>{head}</tr></thead><tbody>{body}</tbody></table>'
+
+
+@st.cache_data(max_entries=FRAGMENT_CACHE_SIZE, show_spinner=False)
+@track_misses("render_profile_fragments")
+def render_profile_fragments(player, data_version, view, _player_matches, _page_rows):
+    """
+    Season-average line over all of a client's matches, and the game-log HTML
+    for the rows on the current page. Memoised on the player, the version of
+    their match data and the view (filters, sort, page); the frames are not
+    hashed. Keeps the FRAGMENT_CACHE_SIZE most recently used views.
+    """
+    average_line = None
+    # Ratings are precomputed in load_match_data
+    valid_ratings = _player_matches["Rating"].dropna().tolist()
+    if valid_ratings:
+        avg_rating = sum(valid_ratings) / len(valid_ratings)
+        average_line = (
+            f"**Season Average Rating:** {rating_to_html(round(avg_rating, 1))} "
+            f"({rating_label(avg_rating)}) from {len(valid_ratings)} rated appearances"
+        )
+    # Layout follows the whole history so it doesn't change between pages
+    is_gk_player = _player_matches["Position"].str.contains("GK", na=False).any()
+    return average_line, render_game_log(_page_rows, is_gk_player)
+
+
+# ─────────────────────────────────────────────
+# DATA LOADING
+# ─────────────────────────────────────────────
+def load_match_frames_incremental(files):
+    """
+    Combine the match rows of all files, re-parsing only files whose fingerprint
+    differs from the manifest written on the previous load.
+    Rows belonging to removed or changed files are dropped before merging.
+    """
+    try:
+        with open(MATCH_MANIFEST, encoding="utf-8") as fh:
+            manifest = json.load(fh)
+        combined = pd.read_parquet(MATCH_COMBINED_CACHE)
+    except (OSError, ImportError, ValueError, TypeError):
+        manifest, combined = {}, None
+
+    current = {f: file_fingerprint(f) for f in files}
+    stale = [f for f in manifest if current.get(f) != manifest[f]]
+    fresh = [f for f in files if manifest.get(f) != current[f]]
+    for f in stale:
+        if f not in current:
+            try:
+                drop_cached(f, CACHE_DIR)  # the export is gone; so is its conversion cache
+            except OSError:
+                pass
+    cache_lookup("match_manifest", hit=combined is not None and not stale and not fresh)
+    if combined is not None and not stale and not fresh:
+        return combined
+
+    parts = []
+    if combined is not None:
+        # Also drop rows for fresh files so a half-written manifest can't duplicate them
+        drop = {player_name_from_path(f) for f in stale + fresh}
+        parts.append(combined[~combined["Player"].isin(drop)])
+    with stage("parse_exports", files=len(fresh), workers=INGEST_WORKERS):
+        parts.extend(ingest_match_files(fresh, CACHE_DIR, INGEST_WORKERS))
+    parts = [p for p in parts if not p.empty]
+    combined = apply_schema_dtypes(pd.concat(parts, ignore_index=True)) if parts else pd.DataFrame()
+
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        combined.to_parquet(MATCH_COMBINED_CACHE + ".tmp", index=False)
+        os.replace(MATCH_COMBINED_CACHE + ".tmp", MATCH_COMBINED_CACHE)
+        with open(MATCH_MANIFEST + ".tmp", "w", encoding="utf-8") as fh:
+            json.dump(current, fh, indent=2)
+        os.replace(MATCH_MANIFEST + ".tmp", MATCH_MANIFEST)
+    except (OSError, ImportError, ValueError, TypeError) as exc:
+        # Caching is best-effort; the next load just re-checks every file
+        logger.warning("could not write the combined match cache %s: %s", MATCH_COMBINED_CACHE, exc)
+    return combined
+
+
+def match_files():
+    return sorted(glob.glob(os.path.join(MATCH_FOLDER, "Player_stats_*.xlsx")))
+
+
+@timed("check_rating_inputs")
+def check_rating_inputs():
+    """Map each player whose export layout lacks rating columns to the missing names."""
+    report = {}
+    for f in match_files():
+        missing = missing_columns(export_columns(f, CACHE_DIR), RATING_COLUMNS)
+        if missing:
+            report[player_name_from_path(f)] = missing
+    return report
+
+
+@timed("load_season_data")
+def load_season_data():
+    df = read_xlsx_cached(SEASON_FILE, pd.read_excel, CACHE_DIR)
+    return df
+
+
+@timed("load_match_data")
+def load_match_data():
+    combined = load_match_frames_incremental(match_files())
+
+    if not combined.empty:
+        # By player ID, so exports that name the same player differently stay contiguous
+        combined = combined.sort_values(
+            ["Player", "Date"], ascending=[True, False],
+            key=lambda col: player_ids(col) if col.name == "Player" else col,
+        )
+        # Score every match once here so the ratings are cached with the data
+        combined["Rating"] = calculate_performance_ratings(combined)
+        if COMPACT_MATCH_DATA:
+            with stage("compact_match_frame"):
+                combined = compact_match_frame(combined, SPARSE_ZERO_SHARE)
+        return combined
+    return pd.DataFrame()
+
+
+# Modules whose code shapes the prepared match frame: parsing, rating and layout
+PREPARED_CODE_MODULES = ["core.py", "ingest.py", "profiles.py", "compact.py"]
+
+
+def prepared_cache_key():
+    """
+    Everything the prepared match frame depends on: the exports, the code that
+    parses, rates and lays it out, the rating profiles and the layout settings.
+    Any change means a rebuild.
+    """
+    here = os.path.dirname(os.path.abspath(__file__))
+    return {
+        "files": {f: file_fingerprint(f) for f in match_files()},
+        "code": {m: file_fingerprint(os.path.join(here, m)) for m in PREPARED_CODE_MODULES},
+        "profiles": file_fingerprint(RATING_PROFILES_FILE),
+        "profile": RATING_PROFILE,
+        "compact": COMPACT_MATCH_DATA,
+        "sparse": SPARSE_ZERO_SHARE,
+    }
+
+
+def load_prepared_match_data():
+    """
+    (match_df, rating_gaps, key) from the prepared-data cache when its key
+    still matches, so a warm start skips parsing, header checks and rating
+    entirely. Otherwise both are rebuilt and written back. key is the
+    prepared_cache_key() the frame was built for, taken before any export was
+    read, so a file that changes mid-load is seen as changed next time.
+    """
+    key = prepared_cache_key()
+    try:
+        with open(PREPARED_MATCH_META, encoding="utf-8") as fh:
+            meta = json.load(fh)
+        if meta["key"] == key:
+            with stage("read_prepared_cache"):
+                matches = pd.read_parquet(PREPARED_MATCH_CACHE)
+                if COMPACT_MATCH_DATA and SPARSE_ZERO_SHARE is not None:
+                    # Stored dense (Parquet has no sparse type); re-sparsify the same columns
+                    matches = compact_match_frame(matches, SPARSE_ZERO_SHARE)
+            cache_lookup("prepared_matches", hit=True)
+            return matches, meta["rating_gaps"], key
+    except (OSError, ImportError, ValueError, TypeError, KeyError):
+        pass  # no usable cache: build from the exports
+    cache_lookup("prepared_matches", hit=False)
+
+    matches = load_match_data()
+    rating_gaps = check_rating_inputs()
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        dense = matches.copy()
+        for col in dense.columns:
+            if isinstance(dense[col].dtype, pd.SparseDtype):
+                dense[col] = dense[col].sparse.to_dense()
+        dense.to_parquet(PREPARED_MATCH_CACHE + ".tmp")
+        os.replace(PREPARED_MATCH_CACHE + ".tmp", PREPARED_MATCH_CACHE)
+        with open(PREPARED_MATCH_META + ".tmp", "w", encoding="utf-8") as fh:
+            json.dump({"key": key, "rating_gaps": rating_gaps}, fh, indent=2)
+        os.replace(PREPARED_MATCH_META + ".tmp", PREPARED_MATCH_META)
+    except (OSError, ImportError, ValueError, TypeError) as exc:
+        # Caching is best-effort; the next load just rebuilds
+        logger.warning("could not write the prepared match cache %s: %s", PREPARED_MATCH_CACHE, exc)
+    return matches, rating_gaps, key
+
+
+def data_fingerprint():
+    """Fingerprints of every source file, used by the watcher to spot changes."""
+    paths = [SEASON_FILE, RATING_PROFILES_FILE] + match_files()
+    return tuple((p, file_fingerprint(p)) for p in paths if os.path.exists(p))
+
+
+def player_ids(names):
+    """player_id of every name in a Series, computed once per distinct name."""
+    names = names.astype(str)
+    return names.map({name: player_id(name) for name in names.unique()})
+
+
+def shared_player_ids(files):
+    """Player IDs that more than one export maps to: id -> the players' names, by file."""
+    names = {}
+    for f in sorted(files):
+        name = player_name_from_path(f)
+        names.setdefault(player_id(name), []).append(name)
+    return {pid: found for pid, found in names.items() if len(found) > 1}
+
+
+def build_player_index(season_df, match_df):
+    """
+    Map each season-overview name to the (start, stop) row range of that
+    player's matches in match_df, which is sorted by player ID. Names are
+    joined on player_id, so a lookup is exact and clients sharing a surname
+    never cross-match; exports that map to the same ID share one range.
+    """
+    ranges = {}
+    if not match_df.empty:
+        ids = player_ids(match_df["Player"]).to_numpy()
+        starts = np.flatnonzero(np.r_[True, ids[1:] != ids[:-1]])
+        stops = np.r_[starts[1:], len(ids)]
+        for start, stop in zip(starts, stops):
+            ranges[ids[start]] = (int(start), int(stop))
+    if season_df.empty:
+        return {}
+    return {name: ranges.get(player_id(name)) for name in season_df["Player"]}
+
+
+def build_player_frames(match_df, player_index):
+    """Per-player views of match_df (newest first), sliced from the index row ranges."""
+    return {name: match_df.iloc[rows[0]:rows[1]] for name, rows in player_index.items() if rows}
+
+
+def matches_between(player_matches, start=None, end=None):
+    """
+    Rows of a player's frame with start <= Date <= end (either bound optional).
+    The frame is newest first with undated rows last, so both bounds are found
+    by binary search instead of a full boolean mask.
+    """
+    if start is None and end is None:
+        return player_matches
+    dates = player_matches["Date"].to_numpy()
+    n_dated = len(dates) - int(pd.isna(dates).sum())
+    ascending = dates[:n_dated][::-1]
+    lo = np.searchsorted(ascending, np.datetime64(pd.Timestamp(start)), "left") if start is not None else 0
+    hi = np.searchsorted(ascending, np.datetime64(pd.Timestamp(end)), "right") if end is not None else n_dated
+    return player_matches.iloc[n_dated - hi:n_dated - lo]
+
+
+def last_n_matches(player_matches, n):
+    """The player's n most recent matches."""
+    return player_matches.iloc[:n]
+
+
+GAME_LOG_SORTS = {"Date": "Date", "Rating": "Rating", "Minutes": "Minutes played"}
+GAME_LOG_PAGE_SIZES = [25, 50, 100]
+# "Matches" game-log option: label -> how many of the most recent matches (None = all)
+GAME_LOG_RECENT = {"All": None, "Last 5": 5, "Last 10": 10, "Last 20": 20}
+
+
+@timed("filter_game_log")
+def filter_game_log(player_matches, competitions=(), positions=(), start=None, end=None, last_n=None):
+    """
+    Game-log filter: the last_n most recent matches (all if None), then date
+    bounds by binary search, then competition/position on that slice.
+    """
+    rows = player_matches if last_n is None else last_n_matches(player_matches, last_n)
+    rows = matches_between(rows, start, end)
+    if competitions:
+        rows = rows[rows["Competition"].astype(str).isin(competitions)]
+    if positions:
+        rows = rows[rows["Position"].astype(str).isin(positions)]
+    return rows
+
+
+@timed("sort_game_log")
+def sort_game_log(rows, sort_by, descending=True):
+    """Order game-log rows by one of GAME_LOG_SORTS; blanks always go last."""
+    if sort_by == "Date" and descending:
+        return rows  # player frames are already newest first
+    return rows.sort_values(GAME_LOG_SORTS[sort_by], ascending=not descending, kind="stable", na_position="last")
+
+
+def build_player_versions(season_df, key):
+    """
+    Version of each client's rated match data: the fingerprints of their export
+    file(s) plus the rating profile they were scored with, as recorded in the
+    prepared_cache_key() the match frame was loaded under (never re-statted,
+    so a version always describes the rows actually loaded).
+    """
+    if season_df.empty:
+        return {}
+    profile = (key["profile"], key["profiles"])
+    versions = {}
+    for f, fp in sorted(key["files"].items()):
+        pid = player_id(player_name_from_path(f))
+        versions[pid] = versions.get(pid, ()) + (fp,)
+    return {name: (versions.get(player_id(name)),) + profile for name in season_df["Player"]}
+
+
+@timed("load_dashboard_data")
+def load_dashboard_data():
+    season = load_season_data()
+    matches, rating_gaps, key = load_prepared_match_data()
+    player_index = build_player_index(season, matches)
+    return {
+        "season": season,
+        "matches": matches,
+        "player_index": player_index,
+        "player_frames": build_player_frames(matches, player_index),
+        "player_versions": build_player_versions(season, key),
+        "rating_gaps": rating_gaps,
+        "shared_ids": shared_player_ids(key["files"]),
+    }
+
+
+@st.cache_resource(on_release=lambda watcher: watcher.stop())
+def get_data_watcher():
+    """One watcher per server process, shared by every session; stopped when the cache releases it."""
+    return DataWatcher(load_dashboard_data, data_fingerprint, WATCH_INTERVAL)
@@ -0,0 +1,365 @@
+"""
+Dashboard page layout shared by every branded variant. A variant script only
+picks its theme and calls run_dashboard(); data and ratings come from core.py.
+
+core.py (and with it pandas, numpy and openpyxl) is imported inside the
+functions that need it, after the page shell has been sent, so a cold
+server draws the sidebar and header before paying for those imports.
+"""
+import os
+
+import streamlit as st
+
+from instrument import cache_call, count, payload, report, stage
+from themes import DEFAULT_THEME, resolve_theme
+
+# Show the performance panel in the sidebar for every page (otherwise only with ?debug=1)
+DEBUG_PANEL = os.environ.get("DASHBOARD_DEBUG", "0") != "0"
+
+
+# ─────────────────────────────────────────────
+# SIDEBAR
+# ─────────────────────────────────────────────
+def render_sidebar(theme):
+    """
+    Brand, rating guide and update steps. Returns the empty slot for the
+    data-dependent lines, which render_sidebar_stats() fills once data is loaded.
+    """
+    with st.sidebar:
+        st.markdown(theme.sidebar_brand, unsafe_allow_html=True)
+        st.markdown("### Client Performance")
+        st.markdown("---")
+        stats = st.container()
+        st.markdown("---")
+        st.markdown("##### Rating Guide")
+        st.markdown("""
+        <div style="font-size: 0.8rem; line-height: 2;">
+        <span class="rating-excellent">8-10</span> Excellent<br>
+        <span class="rating-good">6.5-8</span> Good<br>
+        <span class="rating-average">5-6.5</span> Average<br>
+        <span class="rating-belowavg">3.5-5</span> Below Avg<br>
+        <span class="rating-poor">1-3.5</span> Poor<br>
+        <span class="rating-minimal">—</span> &lt;10 mins
+        </div>
+        """, unsafe_allow_html=True)
+        st.markdown("---")
+        st.markdown("##### How to update")
+        st.markdown("""
+        1. Export match data from Wyscout
+        2. Upload files to GitHub repo
+        3. App will refresh automatically
+        """)
+    return stats
+
+
+def render_sidebar_stats(stats, data, players):
+    """Client count, data freshness and rating-input / shared-export warnings, drawn into the sidebar slot."""
+    import pandas as pd
+
+    match_df = data["matches"]
+    with stats:
+        st.markdown(f"**Clients tracked:** {len(players)}")
+        if not match_df.empty:
+            latest = match_df["Date"].max()
+            if pd.notna(latest):
+                st.markdown(f"**Last updated:** {latest.strftime('%d %b %Y')}")
+        for player, missing in data["rating_gaps"].items():
+            st.warning(f"{player}: export has no {', '.join(missing)} column(s); ratings treat them as 0.")
+        for names in data["shared_ids"].values():
+            st.warning(f"{' / '.join(names)}: exports name the same player, so their matches are shown together.")
+
+
+# ─────────────────────────────────────────────
+# TAB 1: SEASON OVERVIEW
+# ─────────────────────────────────────────────
+def render_season_overview(season_df, players):
+    """Season totals and the all-clients stats table."""
+    if season_df.empty:
+        st.warning("No season data found. Place your season overview file in data/season_overview.xlsx")
+    else:
+        # Top metrics
+        col1, col2, col3, col4, col5 = st.columns(5)
+        with col1:
+            st.metric("Total Clients", len(players))
+        with col2:
+            total_goals = int(season_df["Goals"].sum()) if "Goals" in season_df.columns else 0
+            st.metric("Total Goals", total_goals)
+        with col3:
+            total_assists = int(season_df["Assists"].sum()) if "Assists" in season_df.columns else 0
+            st.metric("Total Assists", total_assists)
+        with col4:
+            total_apps = int(season_df["Matches played"].sum()) if "Matches played" in season_df.columns else 0
+            st.metric("Total Appearances", total_apps)
+        with col5:
+            total_mins = int(season_df["Minutes played"].sum()) if "Minutes played" in season_df.columns else 0
+            st.metric("Total Minutes", f"{total_mins:,}")
+
+        st.markdown("---")
+        st.markdown("#### All Clients — Season Stats")
+
+        display_cols = ["Player", "Team", "Position", "Age", "Matches played",
+                        "Minutes played", "Goals", "Assists", "xG", "xA",
+                        "Duels per 90", "Duels won, %"]
+        available_cols = [c for c in display_cols if c in season_df.columns]
+        overview_df = season_df[available_cols].copy()
+
+        st.dataframe(
+            overview_df,
+            use_container_width=True,
+            hide_index=True,
+            column_config={
+                "Player": st.column_config.TextColumn("PLAYER", width="medium"),
+                "Team": st.column_config.TextColumn("CLUB", width="medium"),
+                "Position": st.column_config.TextColumn("POS", width="small"),
+                "Age": st.column_config.NumberColumn("AGE", width="small"),
+                "Matches played": st.column_config.NumberColumn("APPS", width="small"),
+                "Minutes played": st.column_config.NumberColumn("MINS", width="small", format="%d"),
+                "Goals": st.column_config.NumberColumn("G", width="small"),
+                "Assists": st.column_config.NumberColumn("A", width="small"),
+                "xG": st.column_config.NumberColumn("xG", width="small", format="%.1f"),
+                "xA": st.column_config.NumberColumn("xA", width="small", format="%.1f"),
+                "Duels per 90": st.column_config.NumberColumn("DUELS/90", width="small", format="%.1f"),
+                "Duels won, %": st.column_config.NumberColumn("DUEL%", width="small", format="%.1f"),
+            }
+        )
+
+# ─────────────────────────────────────────────
+# TAB 2: PLAYER PROFILE
+# ─────────────────────────────────────────────
+def render_player_profile(data, players):
+    """Selected client's header, key metrics and game-by-game log."""
+    import pandas as pd
+
+    from core import (
+        GAME_LOG_PAGE_SIZES, GAME_LOG_RECENT, GAME_LOG_SORTS, filter_game_log, player_id,
+        render_profile_fragments, sort_game_log,
+    )
+
+    season_df = data["season"]
+    match_df = data["matches"]
+    if not players:
+        st.warning("No player data loaded.")
+    else:
+        selected_player = st.selectbox("Select Client", players, key="profile_player")
+
+        # Get season stats
+        player_season = season_df[season_df["Player"] == selected_player]
+        if not player_season.empty:
+            ps = player_season.iloc[0]
+
+            # Header
+            st.markdown(f"## {selected_player}")
+            pos = ps.get("Position", "N/A")
+            team = ps.get("Team", "N/A")
+            age = ps.get("Age", "N/A")
+            st.markdown(
+                f'<span class="club-badge">{team}</span> '
+                f'<span class="position-badge">{pos}</span> '
+                f'<span class="club-badge">Age: {age}</span>',
+                unsafe_allow_html=True
+            )
+            st.markdown("")
+
+            # Key metrics
+            is_gk = "GK" in str(pos)
+            if is_gk:
+                c1, c2, c3, c4, c5, c6 = st.columns(6)
+                with c1:
+                    st.metric("Appearances", int(ps.get("Matches played", 0)))
+                with c2:
+                    st.metric("Minutes", f"{int(ps.get('Minutes played', 0)):,}")
+                with c3:
+                    st.metric("Clean Sheets", int(ps.get("Clean sheets", 0)))
+                with c4:
+                    sr = ps.get("Save rate, %", 0)
+                    st.metric("Save Rate", f"{sr:.1f}%" if pd.notna(sr) else "N/A")
+                with c5:
+                    st.metric("Conceded", int(ps.get("Conceded goals", 0)))
+                with c6:
+                    pg = ps.get("Prevented goals", 0)
+                    st.metric("Goals Prevented", f"{pg:.1f}" if pd.notna(pg) else "N/A")
+            else:
+                c1, c2, c3, c4, c5, c6 = st.columns(6)
+                with c1:
+                    st.metric("Appearances", int(ps.get("Matches played", 0)))
+                with c2:
+                    st.metric("Minutes", f"{int(ps.get('Minutes played', 0)):,}")
+                with c3:
+                    st.metric("Goals", int(ps.get("Goals", 0)))
+                with c4:
+                    st.metric("Assists", int(ps.get("Assists", 0)))
+                with c5:
+                    xg = ps.get("xG", 0)
+                    st.metric("xG", f"{xg:.2f}" if pd.notna(xg) else "0")
+                with c6:
+                    xa = ps.get("xA", 0)
+                    st.metric("xA", f"{xa:.2f}" if pd.notna(xa) else "0")
+
+        # Game by game log
+        st.markdown("---")
+        st.markdown("#### Game by Game")
+
+        if match_df.empty:
+            st.info("No match-by-match data loaded.")
+        else:
+            player_matches = data["player_frames"].get(selected_player, match_df.iloc[0:0])
+
+            if player_matches.empty:
+                st.info(f"No match data found for {selected_player}.")
+            else:
+                # Filter, sort and paginate server-side so only one page of rows is sent
+                key = f"log_{player_id(selected_player)}"
+                f1, f2, f3, f4 = st.columns(4)
+                with f1:
+                    competitions = st.multiselect(
+                        "Competition", sorted(player_matches["Competition"].dropna().astype(str).unique()),
+                        key=f"{key}_competitions",
+                    )
+                with f2:
+                    positions = st.multiselect(
+                        "Position", sorted(player_matches["Position"].dropna().astype(str).unique()),
+                        key=f"{key}_positions",
+                    )
+                with f3:
+                    dated = player_matches["Date"].dropna()
+                    start = end = None
+                    if not dated.empty:
+                        first, last = dated.min().date(), dated.max().date()
+                        # Keyed on the span so the picker re-seeds when the watcher loads newer matches
+                        date_range = st.date_input(
+                            "Dates", value=(first, last), min_value=first, max_value=last,
+                            key=f"{key}_dates_{first.isoformat()}_{last.isoformat()}",
+                        )
+                        # Only a narrower range filters; the full span keeps undated matches too
+                        if len(date_range) > 0 and date_range[0] != first:
+                            start = date_range[0]
+                        if len(date_range) > 1 and date_range[1] != last:
+                            end = date_range[1]
+                with f4:
+                    recent = st.selectbox("Matches", list(GAME_LOG_RECENT), key=f"{key}_recent")
+                s1, s2, s3 = st.columns(3)
+                with s1:
+                    sort_by = st.selectbox("Sort by", list(GAME_LOG_SORTS), key=f"{key}_sort")
+                with s2:
+                    order = st.selectbox("Order", ["Descending", "Ascending"], key=f"{key}_order")
+                with s3:
+                    page_size = st.selectbox("Rows per page", GAME_LOG_PAGE_SIZES, index=1, key=f"{key}_page_size")
+
+                rows = filter_game_log(player_matches, competitions, positions, start, end, GAME_LOG_RECENT[recent])
+                rows = sort_game_log(rows, sort_by, descending=order == "Descending")
+
+                n_pages = max(1, -(-len(rows) // page_size))
+                page = 1
+                if n_pages > 1:
+                    # Filters may have shrunk the log below the page the user was on
+                    if st.session_state.get(f"{key}_page", 1) > n_pages:
+                        st.session_state[f"{key}_page"] = n_pages
+                    page = st.number_input("Page", min_value=1, max_value=n_pages, value=1, key=f"{key}_page")
+                page_rows = rows.iloc[(page - 1) * page_size:page * page_size]
+
+                view = (tuple(competitions), tuple(positions), start, end, recent, sort_by, order, page_size, page)
+                with cache_call("render_profile_fragments"):
+                    average_line, html = render_profile_fragments(
+                        selected_player, data["player_versions"].get(selected_player), view, player_matches, page_rows
+                    )
+                payload("game_log_html", html)
+                if average_line:
+                    st.markdown(average_line, unsafe_allow_html=True)
+                if rows.empty:
+                    st.info("No matches fit these filters.")
+                else:
+                    st.caption(
+                        f"Showing {(page - 1) * page_size + 1}–{(page - 1) * page_size + len(page_rows)} "
+                        f"of {len(rows)} matches"
+                    )
+                    st.markdown(html, unsafe_allow_html=True)
+
+
+# ─────────────────────────────────────────────
+# DEBUG PANEL
+# ─────────────────────────────────────────────
+def render_debug_panel():
+    """Process-wide stage timings, cache hit ratios, payload sizes and rerun counts."""
+    import pandas as pd
+
+    from ingest import schema_cache_info
+
+    perf = report()
+    with st.sidebar.expander("⚙️ Performance", expanded=True):
+        st.markdown(
+            f"**Reruns:** {st.session_state.get('_reruns', 0)} this session, "
+            f"{perf['counters'].get('reruns', 0)} in this process"
+        )
+        stages = pd.DataFrame([
+            {"stage": name, "calls": s["calls"], "last ms": s["last_ms"],
+             "mean ms": s["total_ms"] / s["calls"], "max ms": s["max_ms"]}
+            for name, s in perf["stages"].items()
+        ])
+        if not stages.empty:
+            st.dataframe(stages.sort_values("last ms", ascending=False).round(1), hide_index=True)
+        caches = dict(perf["caches"])
+        schema = schema_cache_info()
+        caches["header schema memo"] = (schema["hits"], schema["misses"],
+                                        schema["hits"] / (schema["hits"] + schema["misses"])
+                                        if schema["hits"] + schema["misses"] else None)
+        st.dataframe(pd.DataFrame([
+            {"cache": name, "hits": hits, "misses": misses,
+             "hit ratio": f"{ratio:.0%}" if ratio is not None else "—"}
+            for name, (hits, misses, ratio) in caches.items()
+        ]), hide_index=True)
+        if perf["payloads"]:
+            st.dataframe(pd.DataFrame([
+                {"payload": name, "last KB": p["last_bytes"] / 1024, "max KB": p["max_bytes"] / 1024}
+                for name, p in perf["payloads"].items()
+            ]).round(1), hide_index=True)
+
+
+# ─────────────────────────────────────────────
+# PAGE
+# ─────────────────────────────────────────────
+def run_dashboard(theme_name=DEFAULT_THEME):
+    """
+    Draw the whole dashboard. The theme comes from the ?theme= query parameter
+    when it names one in themes.THEMES, else from DASHBOARD_THEME, else
+    theme_name. Every theme reads the same process-wide data watcher, so one
+    server can serve all brands.
+    """
+    theme = resolve_theme(st.query_params.get("theme"), theme_name)
+    st.set_page_config(
+        page_title="Beswicks Sports — Client Dashboard",
+        page_icon="⚽",
+        layout="wide",
+        initial_sidebar_state="expanded",
+    )
+    st.markdown(theme.css, unsafe_allow_html=True)
+    payload("theme_css", theme.css)
+    count("reruns")
+    st.session_state["_reruns"] = st.session_state.get("_reruns", 0) + 1
+
+    # Shell first: nothing above needs core.py or the data
+    stats = render_sidebar(theme)
+    for line in theme.header:
+        st.markdown(line, unsafe_allow_html=True)
+    st.markdown("---")
+
+    with st.spinner("Loading client data…"):
+        from core import get_data_watcher
+
+        with stage("data_snapshot"):
+            data = get_data_watcher().snapshot()
+    season_df = data["season"]
+    players = season_df["Player"].tolist() if not season_df.empty else []
+    render_sidebar_stats(stats, data, players)
+
+    # on_change="rerun" lets Streamlit track the selected tab, so only that tab's
+    # body runs: overview interactions never rate or render a player profile
+    tab1, tab2 = st.tabs(["📊 SEASON OVERVIEW", "👤 PLAYER PROFILE"], key="main_tab", on_change="rerun")
+    if tab1.open:
+        with tab1, stage("render_season_overview"):
+            render_season_overview(season_df, players)
+    if tab2.open:
+        with tab2, stage("render_player_profile"):
+            render_player_profile(data, players)
+
+    if DEBUG_PANEL or st.query_params.get("debug") == "1":
+        render_debug_panel()
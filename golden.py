@@ -0,0 +1,181 @@
+"""
+Golden-output check for the rating model. The ratings of every row in the
+bundled Player_stats_*.xlsx exports are frozen in golden_ratings.json; every
+rating engine must reproduce them bit-for-bit, and each optimised engine must
+stay at least its MIN_SPEEDUP faster than the reference engine:
+
+    python golden.py            # check all engines and classifiers; exit status 1 on any failure
+    python golden.py --write    # re-freeze after an intended model change
+
+Timings run on the bundled rows repeated to TIMING_ROWS rows, best of
+TIMING_REPEATS, with the reference timed in the same run so the check holds on
+any machine; --no-timing skips them.
+"""
+import argparse
+import glob
+import json
+import math
+import os
+import sys
+import time
+
+import pandas as pd
+
+import core
+from ingest import RATE_COLUMNS, apply_schema_dtypes, parse_match_file, widen_rate
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+GOLDEN_FILE = os.path.join(HERE, "golden_ratings.json")
+TIMING_ROWS = 10_000
+TIMING_REPEATS = 3
+
+
+# ─────────────────────────────────────────────
+# ENGINES
+# ─────────────────────────────────────────────
+def rate_scalar(match_df):
+    """The reference engine: calculate_performance_rating row by row on float64 inputs."""
+    df = match_df.copy()
+    for col in RATE_COLUMNS:
+        if col in df.columns:
+            df[col] = widen_rate(df[col])
+    ratings = []
+    for _, row in df.iterrows():
+        mins = core.safe_float(row.get("Minutes played", 0))
+        pos_group = core.get_position_group(row.get("Position", ""))
+        ratings.append(core.calculate_performance_rating(row, pos_group, mins))
+    return ratings
+
+
+def rate_vectorised(match_df):
+    return core.calculate_performance_ratings(match_df).tolist()
+
+
+# Every engine that must match the golden ratings: name -> fn(match_df) -> list of float or None
+ENGINES = {
+    "calculate_performance_rating": rate_scalar,
+    "calculate_performance_ratings": rate_vectorised,
+}
+
+# Timing is relative to this engine, measured on the same machine in the same run
+REFERENCE_ENGINE = "calculate_performance_rating"
+# Minimum speed-up over the reference engine: name -> reference seconds / engine seconds
+MIN_SPEEDUP = {
+    "calculate_performance_ratings": 20.0,
+}
+
+# Every position classifier that must match the golden groups: name -> fn(positions) -> groups
+CLASSIFIERS = {
+    "get_position_group": lambda positions: [core.get_position_group(p) for p in positions],
+    "position_groups": lambda positions: list(core.position_groups(positions)),
+}
+
+
+# ─────────────────────────────────────────────
+# GOLDEN FILE
+# ─────────────────────────────────────────────
+def load_bundled_matches():
+    """All bundled exports parsed straight from the xlsx (no caches), in file then row order."""
+    files = sorted(glob.glob(os.path.join(HERE, "Player_stats_*.xlsx")))
+    return apply_schema_dtypes(pd.concat([parse_match_file(f) for f in files], ignore_index=True))
+
+
+def _number(value):
+    """JSON-safe rating: None for not rated (None or NaN), else the float itself."""
+    if value is None or (isinstance(value, float) and math.isnan(value)):
+        return None
+    return float(value)
+
+
+def _same_bits(a, b):
+    if a is None or b is None:
+        return a is None and b is None
+    return float(a).hex() == float(b).hex()
+
+
+def time_engine(fn, match_df):
+    """Best-of-TIMING_REPEATS seconds for fn over match_df repeated to TIMING_ROWS rows."""
+    reps = max(1, -(-TIMING_ROWS // max(len(match_df), 1)))
+    big = pd.concat([match_df] * reps, ignore_index=True).iloc[:TIMING_ROWS]
+    best = math.inf
+    for _ in range(TIMING_REPEATS):
+        start = time.perf_counter()
+        fn(big)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def freeze(match_df):
+    """Golden record: one entry per row, rated by the reference engine."""
+    ratings = rate_scalar(match_df)
+    rows = []
+    for i, rating in enumerate(ratings):
+        row = match_df.iloc[i]
+        rows.append({
+            "player": str(row["Player"]),
+            "match": str(row["Match"]),
+            "date": row["Date"].strftime("%Y-%m-%d") if pd.notna(row["Date"]) else None,
+            "position": None if pd.isna(row.get("Position")) else str(row["Position"]),
+            "group": core.get_position_group(row.get("Position", "")),
+            "rating": _number(rating),
+        })
+    return {"rows": rows}
+
+
+def check(golden, match_df, timing=True):
+    """Return a list of failure messages (empty = all engines match and are fast enough)."""
+    failures = []
+    expected = [r["rating"] for r in golden["rows"]]
+    if len(match_df) != len(expected):
+        return [f"bundled exports have {len(match_df)} rows, golden file has {len(expected)}"]
+
+    positions = match_df["Position"] if "Position" in match_df.columns else pd.Series([None] * len(match_df))
+    for name, fn in CLASSIFIERS.items():
+        for i, (group, row) in enumerate(zip(fn(positions), golden["rows"])):
+            if group != row["group"]:
+                failures.append(f"{name}: row {i} ({row['position']!r}) gave {group!r}, golden {row['group']!r}")
+
+    for name, fn in ENGINES.items():
+        got = [_number(r) for r in fn(match_df)]
+        bad = [i for i, (a, b) in enumerate(zip(got, expected)) if not _same_bits(a, b)]
+        if len(got) != len(expected):
+            failures.append(f"{name}: {len(got)} ratings for {len(expected)} rows")
+        for i in bad[:10]:
+            row = golden["rows"][i]
+            failures.append(f"{name}: {row['player']} {row['date']} {row['match']}: {got[i]!r} != golden {expected[i]!r}")
+        if len(bad) > 10:
+            failures.append(f"{name}: ... and {len(bad) - 10} more mismatched rows")
+
+    if timing and MIN_SPEEDUP:
+        reference = time_engine(ENGINES[REFERENCE_ENGINE], match_df)
+        print(f"{REFERENCE_ENGINE}: {reference:.4f}s for {TIMING_ROWS} rows (reference)")
+        for name, minimum in MIN_SPEEDUP.items():
+            seconds = time_engine(ENGINES[name], match_df)
+            speedup = reference / seconds if seconds else math.inf
+            print(f"{name}: {seconds:.4f}s for {TIMING_ROWS} rows, {speedup:.1f}x (minimum {minimum:.1f}x)")
+            if speedup < minimum:
+                failures.append(f"{name}: only {speedup:.1f}x faster than {REFERENCE_ENGINE}, minimum {minimum:.1f}x")
+    return failures
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Check rating engines against the frozen golden ratings.")
+    parser.add_argument("--write", action="store_true", help=f"re-freeze {os.path.basename(GOLDEN_FILE)}")
+    parser.add_argument("--no-timing", action="store_true", help="skip the speed-up checks")
+    args = parser.parse_args()
+
+    matches = load_bundled_matches()
+    if args.write:
+        golden = freeze(matches)
+        with open(GOLDEN_FILE, "w", encoding="utf-8") as fh:
+            json.dump(golden, fh, indent=1, ensure_ascii=False)
+        print(f"froze {len(golden['rows'])} ratings to {GOLDEN_FILE}")
+        sys.exit(0)
+
+    with open(GOLDEN_FILE, encoding="utf-8") as fh:
+        golden = json.load(fh)
+    failures = check(golden, matches, timing=not args.no_timing)
+    for failure in failures:
+        print(f"FAIL {failure}")
+    print(f"{len(golden['rows'])} rows, {len(ENGINES)} engines, {len(CLASSIFIERS)} classifiers: {'FAILED' if failures else 'ok'}")
+    sys.exit(1 if failures else 0)
@@ -0,0 +1,311 @@
+"""
+File-level ingestion of Wyscout xlsx exports: header repair and schema
+resolution, type coercion, the Parquet conversion cache and parallel parsing.
+
+Kept out of the Streamlit script so worker processes can import it.
+"""
+import glob
+import hashlib
+import multiprocessing
+import os
+import re
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import repeat
+
+import numpy as np
+import pandas as pd
+from openpyxl import load_workbook
+
+TEXT_COLUMNS = ["Player", "Match"]
+CATEGORY_COLUMNS = ["Competition", "Position"]
+# Per-match rates; every other numeric column is a count
+RATE_COLUMNS = ["xG", "xA", "xCG"]
+# Rates are stored as float32 and never carry more decimals than this, so
+# widen_rate() can restore the exact float64 value read from the xlsx
+RATE_DECIMALS = 4
+
+
+# ─────────────────────────────────────────────
+# CONVERSION CACHE
+# ─────────────────────────────────────────────
+def file_fingerprint(path):
+    """Identify one version of a file by its mtime and size."""
+    stat = os.stat(path)
+    return f"{stat.st_mtime_ns}-{stat.st_size}"
+
+
+def _cache_path(path, cache_dir):
+    """Columnar cache file for an xlsx, keyed by its path, mtime and size."""
+    key = f"{os.path.abspath(path)}|{file_fingerprint(path)}"
+    digest = hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+    return os.path.join(cache_dir, f"{os.path.basename(path)}.{digest}.parquet")
+
+
+def drop_cached(path, cache_dir):
+    """Delete every cache entry of an xlsx, whatever fingerprint it was written under."""
+    for old in glob.glob(os.path.join(cache_dir, glob.escape(os.path.basename(path)) + ".*.parquet")):
+        os.remove(old)
+
+
+def read_xlsx_cached(path, parse, cache_dir):
+    """
+    Return parse(path), going through the Parquet cache in cache_dir.
+    Only exports whose mtime or size changed since the last load are re-parsed.
+    """
+    cache_file = _cache_path(path, cache_dir)
+    if os.path.exists(cache_file):
+        try:
+            return pd.read_parquet(cache_file)
+        except (OSError, ImportError, ValueError, TypeError):
+            pass  # unreadable cache entry: fall back to the xlsx
+
+    df = parse(path)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        drop_cached(path, cache_dir)
+        tmp_file = cache_file + ".tmp"
+        df.to_parquet(tmp_file, index=False)
+        os.replace(tmp_file, cache_file)
+    except (OSError, ImportError, ValueError, TypeError):
+        pass  # caching is best-effort; the parsed frame is still returned
+    return df
+
+
+# ─────────────────────────────────────────────
+# MATCH EXPORT PARSING
+# ─────────────────────────────────────────────
+def player_name_from_path(path):
+    """Player name encoded in a Player_stats_*.xlsx filename."""
+    basename = os.path.basename(path)
+    return basename.replace("Player_stats_", "").replace(".xlsx", "").replace("__", " ").replace("_", " ").strip()
+
+
+def player_id(name):
+    """
+    Canonical player ID shared by season-overview names and export filenames:
+    first initial plus the remaining name, case-folded and without punctuation,
+    so "K. McAllister", "K McAllister" and "Kyle McAllister" all give "k mcallister".
+    """
+    tokens = re.sub(r"[^\w\s]", " ", str(name)).casefold().split()
+    if not tokens:
+        return ""
+    return " ".join([tokens[0][0]] + tokens[1:])
+
+
+def repair_headers(headers_row):
+    """
+    Fix the merged-cell header row of a Wyscout export: "Duels / won" followed
+    by a blank becomes "Duels" and "Duels_won", other blanks get a "_part2"
+    suffix, and repeated names are de-duplicated with a counter.
+    """
+    fixed_headers = []
+    last_named = ""
+    for h in headers_row:
+        if h is None or pd.isna(h):
+            if "/" in last_named:
+                parts = last_named.split("/")
+                base = parts[0].strip()
+                second_part = parts[1].strip()
+                fixed_headers[-1] = base
+                fixed_headers.append(f"{base}_{second_part}")
+            else:
+                fixed_headers.append(f"{last_named}_part2")
+        else:
+            fixed_headers.append(str(h))
+            last_named = str(h)
+
+    seen = {}
+    unique_headers = []
+    for h in fixed_headers:
+        if h in seen:
+            seen[h] += 1
+            unique_headers.append(f"{h}_{seen[h]}")
+        else:
+            seen[h] = 0
+            unique_headers.append(h)
+    return unique_headers
+
+
+# ─────────────────────────────────────────────
+# HEADER SCHEMAS
+# ─────────────────────────────────────────────
+# Wyscout exports share a handful of header layouts, so each distinct raw
+# header row is resolved once per process and reused for every later file.
+MatchSchema = namedtuple("MatchSchema", ["fingerprint", "columns", "dtypes"])
+
+
+def column_kind(column):
+    """Declared type of a repaired column: "date", "text", "category", "rate" or "count"."""
+    if column == "Date":
+        return "date"
+    if column in TEXT_COLUMNS:
+        return "text"
+    if column in CATEGORY_COLUMNS:
+        return "category"
+    if column in RATE_COLUMNS:
+        return "rate"
+    return "count"
+
+
+def coerce_column(values, kind):
+    """
+    Convert a column's raw values to its declared compact dtype: datetime64,
+    str, category, float32 for rates and nullable int16 for counts. Counts
+    that turn out fractional or too large for int16 are kept as float32.
+    """
+    series = values if isinstance(values, pd.Series) else pd.Series(values, dtype=object)
+    if kind == "date":
+        return pd.to_datetime(series, errors="coerce")
+    if kind in ("text", "category"):
+        text = series.where(series.isna(), series.astype(str))
+        return text.astype("category") if kind == "category" else text
+    numeric = pd.to_numeric(series, errors="coerce")
+    if kind == "count":
+        present = numeric.dropna()
+        fits_int16 = present.empty or ((present % 1 == 0).all() and present.abs().max() <= np.iinfo(np.int16).max)
+        if fits_int16:
+            return numeric.astype("Int16")
+    return numeric.astype("float32")
+
+
+def apply_schema_dtypes(df):
+    """Re-apply declared dtypes to columns that lost them, e.g. categories merged by pd.concat."""
+    for col in df.columns:
+        kind = column_kind(col)
+        dtype = df[col].dtype
+        if kind == "category" and not isinstance(dtype, pd.CategoricalDtype):
+            df[col] = coerce_column(df[col], kind)
+        elif kind in ("rate", "count") and str(dtype) not in ("Int16", "float32"):
+            df[col] = coerce_column(df[col], kind)
+    return df
+
+
+def widen_rate(series):
+    """float64 values of a float32 rate column, exactly as they were in the export."""
+    return np.round(series.to_numpy(dtype=float, na_value=np.nan), RATE_DECIMALS)
+
+
+@lru_cache(maxsize=None)
+def _resolve_schema(header):
+    fingerprint = hashlib.sha1(repr(header).encode("utf-8")).hexdigest()[:12]
+    columns = tuple(repair_headers(header))
+    return MatchSchema(fingerprint, columns, {c: column_kind(c) for c in columns})
+
+
+def resolve_schema(headers_row):
+    """Resolved columns and dtype kinds for a raw header row (memoised per layout)."""
+    return _resolve_schema(tuple(headers_row))
+
+
+def schema_cache_info():
+    """Number of distinct header layouts resolved so far, plus memo hits/misses."""
+    info = _resolve_schema.cache_info()
+    return {"layouts": info.currsize, "hits": info.hits, "misses": info.misses}
+
+
+def read_schema(path):
+    """Resolve the schema of an export from its header row alone, without reading the data."""
+    wb = load_workbook(path, read_only=True, data_only=True, keep_links=False)
+    try:
+        rows = wb.worksheets[0].iter_rows(values_only=True, max_row=1)
+        return resolve_schema([None if v == "" else v for v in next(rows, ())])
+    finally:
+        wb.close()
+
+
+def export_columns(path, cache_dir):
+    """
+    Column names of a parsed match export. Taken from the footer of its
+    Parquet cache entry when there is one, so a warm check never opens the
+    xlsx; otherwise resolved from the header row.
+    """
+    cache_file = _cache_path(path, cache_dir)
+    if os.path.exists(cache_file):
+        try:
+            import pyarrow.parquet as pq
+            return [c for c in pq.read_schema(cache_file).names if c != "Player"]
+        except (OSError, ImportError, ValueError):
+            pass  # unreadable cache entry: fall back to the xlsx header
+    return read_schema(path).columns
+
+
+def missing_columns(columns, required):
+    """Columns from required that are not among columns."""
+    return [c for c in required if c not in columns]
+
+
+def read_sheet_columns(path):
+    """
+    Stream the first sheet of an xlsx with openpyxl in read-only, values-only mode.
+    Returns the raw header row and one list of cell values per column, without
+    materialising an intermediate DataFrame. As with pd.read_excel, empty
+    strings are read as missing and trailing blank rows are dropped.
+    """
+    wb = load_workbook(path, read_only=True, data_only=True, keep_links=False)
+    try:
+        rows = wb.worksheets[0].iter_rows(values_only=True)
+        header = [None if v == "" else v for v in next(rows, ())]
+        columns = [[] for _ in header]
+        blank_run = 0
+        for row in rows:
+            row = [None if v == "" else v for v in row]
+            if all(v is None for v in row):
+                blank_run += 1
+                continue
+            for col in columns:
+                col.extend([None] * blank_run)
+            blank_run = 0
+            for i, col in enumerate(columns):
+                col.append(row[i] if i < len(row) else None)
+        return header, columns
+    finally:
+        wb.close()
+
+
+def parse_match_file(path):
+    """Read one Wyscout Player_stats export, repair its headers and coerce types."""
+    headers_row, raw_columns = read_sheet_columns(path)
+    schema = resolve_schema(headers_row)
+
+    # Typed per column straight from the streamed cell values
+    n_rows = len(raw_columns[0]) if raw_columns else 0
+    data = {"Player": pd.Series([player_name_from_path(path)] * n_rows)}
+    for col, values in zip(schema.columns, raw_columns):
+        data[col] = coerce_column(values, schema.dtypes[col])
+    return pd.DataFrame(data)
+
+
+# ─────────────────────────────────────────────
+# PARALLEL INGESTION
+# ─────────────────────────────────────────────
+def available_cpus():
+    """CPUs this process may run on (the container's limit, not the host's count)."""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def _pool_context():
+    # The pool is started from the Streamlit server, which has live threads
+    # (tornado, the data watcher); forking such a process can deadlock.
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+
+
+def _read_match_file(path, cache_dir):
+    return read_xlsx_cached(path, parse_match_file, cache_dir)
+
+
+def ingest_match_files(files, cache_dir, workers=1):
+    """
+    Parse match exports (through the conversion cache) and return their frames
+    in the same order as files. With workers > 1 the files are spread over a
+    process pool; the output is identical to the serial path.
+    """
+    workers = min(workers, len(files))
+    if workers <= 1:
+        return [_read_match_file(f, cache_dir) for f in files]
+    with ProcessPoolExecutor(max_workers=workers, mp_context=_pool_context()) as pool:
+        return list(pool.map(_read_match_file, files, repeat(cache_dir)))
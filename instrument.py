@@ -0,0 +1,146 @@
+"""
+Per-stage timings and counters for the dashboard's hot paths.
+
+Stages (loaders, rating, filtering, game-log rendering) are timed with
+stage() or @timed and aggregated process-wide, so the debug sidebar panel
+(?debug=1 or DASHBOARD_DEBUG=1) can show where a slow view spent its time.
+With PERF_LOG=1 every stage and payload is also written as a structured log
+line on the "beswicks.perf" logger:
+
+    perf {"event": "stage", "stage": "parse_exports", "ms": 412.7, "files": 6, "workers": 8}
+"""
+import functools
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+PERF_LOG = os.environ.get("PERF_LOG", "0") != "0"
+
+logger = logging.getLogger("beswicks.perf")
+if PERF_LOG and not logger.handlers:
+    _handler = logging.StreamHandler()
+    _handler.setFormatter(logging.Formatter("%(asctime)s %(name)s %(message)s"))
+    logger.addHandler(_handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+_lock = threading.Lock()
+_stages = {}    # name -> {"calls", "total_ms", "last_ms", "max_ms"}
+_counters = {}  # name -> int
+_payloads = {}  # name -> {"count", "last_bytes", "max_bytes"}
+_local = threading.local()  # per script thread: did a @track_misses body run?
+
+
+def _log(event, **fields):
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("perf %s", json.dumps({"event": event, **fields}, default=str))
+
+
+# ─────────────────────────────────────────────
+# RECORDING
+# ─────────────────────────────────────────────
+@contextmanager
+def stage(name, **fields):
+    """Time the enclosed block as one call of the named stage; fields go to the log line."""
+    start = time.perf_counter()
+    try:
+        yield fields
+    finally:
+        ms = (time.perf_counter() - start) * 1000
+        with _lock:
+            s = _stages.setdefault(name, {"calls": 0, "total_ms": 0.0, "last_ms": 0.0, "max_ms": 0.0})
+            s["calls"] += 1
+            s["total_ms"] += ms
+            s["last_ms"] = ms
+            s["max_ms"] = max(s["max_ms"], ms)
+        _log("stage", stage=name, ms=round(ms, 2), **fields)
+
+
+def timed(name):
+    """Decorator form of stage() for a whole function."""
+    def wrap(fn):
+        @functools.wraps(fn)
+        def inner(*args, **kwargs):
+            with stage(name):
+                return fn(*args, **kwargs)
+        return inner
+    return wrap
+
+
+def count(name, n=1):
+    """Add n to a counter, e.g. reruns or cache hits/misses."""
+    with _lock:
+        _counters[name] = _counters.get(name, 0) + n
+
+
+def cache_lookup(name, hit):
+    """Record one lookup of a cache as a hit or a miss."""
+    count(f"{name}.{'hit' if hit else 'miss'}")
+
+
+def track_misses(name):
+    """
+    Decorator for the body of an st.cache_data function (placed under the
+    cache decorator): the body only runs on a miss, so it flags one for
+    cache_call() in the same script thread.
+    """
+    def wrap(fn):
+        @functools.wraps(fn)
+        def inner(*args, **kwargs):
+            setattr(_local, name, True)
+            return fn(*args, **kwargs)
+        return inner
+    return wrap
+
+
+@contextmanager
+def cache_call(name):
+    """Record the enclosed call of a @track_misses cached function as a hit or a miss."""
+    setattr(_local, name, False)
+    yield
+    cache_lookup(name, hit=not getattr(_local, name, False))
+
+
+def payload(name, text):
+    """Record the UTF-8 size of a block of text sent to the browser (e.g. st.markdown HTML)."""
+    size = len(text.encode("utf-8"))
+    with _lock:
+        p = _payloads.setdefault(name, {"count": 0, "last_bytes": 0, "max_bytes": 0})
+        p["count"] += 1
+        p["last_bytes"] = size
+        p["max_bytes"] = max(p["max_bytes"], size)
+    _log("payload", payload=name, bytes=size)
+
+
+# ─────────────────────────────────────────────
+# REPORTING
+# ─────────────────────────────────────────────
+def cache_ratios():
+    """Hit ratio of every cache recorded with cache_lookup(): name -> (hits, misses, ratio)."""
+    with _lock:
+        counters = dict(_counters)
+    names = {key.rsplit(".", 1)[0] for key in counters if key.endswith((".hit", ".miss"))}
+    ratios = {}
+    for name in sorted(names):
+        hits, misses = counters.get(f"{name}.hit", 0), counters.get(f"{name}.miss", 0)
+        ratios[name] = (hits, misses, hits / (hits + misses) if hits + misses else None)
+    return ratios
+
+
+def report():
+    """Copy of everything recorded so far: stages, counters, payloads and cache ratios."""
+    with _lock:
+        stages = {name: dict(s) for name, s in _stages.items()}
+        counters = dict(_counters)
+        payloads = {name: dict(p) for name, p in _payloads.items()}
+    return {"stages": stages, "counters": counters, "payloads": payloads, "caches": cache_ratios()}
+
+
+def reset():
+    with _lock:
+        _stages.clear()
+        _counters.clear()
+        _payloads.clear()
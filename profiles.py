@@ -0,0 +1,244 @@
+"""
+Rating weight profiles: the per-position weights of the rating model,
+declared in rating_profiles.json instead of code, and compiled into one
+numpy expression per position group.
+
+A group is a base score plus terms added (or, with "subtract", taken away)
+left to right. A term is either a weighted sum of features ("features":
+{name: weight}) or a plain sum times one weight ("sum": [names], "weight"),
+optionally clipped with "min"/"max" and replaced by "otherwise" where the
+"only_if" feature is 0. Features are computed once per match frame by
+rating_features(), so any number of profiles can be evaluated over the same
+rows for an A/B comparison:
+
+    python profiles.py default xg_weighted
+"""
+import json
+import os
+import sys
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+from ingest import widen_rate
+
+PROFILES_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "rating_profiles.json")
+# Groups every profile must define; anything unclassified is rated as "outfield"
+POSITION_GROUPS = ["gk", "cb", "fb", "mid", "forward", "outfield"]
+
+CompiledProfile = namedtuple("CompiledProfile", ["name", "source", "evaluate"])
+
+
+class ProfileError(ValueError):
+    """A rating profile that does not describe a valid model."""
+
+
+# ─────────────────────────────────────────────
+# FEATURES
+# ─────────────────────────────────────────────
+def stat_values(df, col):
+    """Vectorised safe_float: a column as a float array, 0 where missing."""
+    if col not in df.columns:
+        return np.zeros(len(df))
+    values = pd.to_numeric(df[col], errors="coerce")
+    if values.dtype == np.float32:
+        return np.nan_to_num(widen_rate(values))
+    return values.fillna(0).to_numpy(dtype=float)
+
+
+def pct_values(numerator, denominator, default):
+    """Vectorised safe_pct, falling back to default where the denominator is 0."""
+    pct = np.divide(numerator, denominator, out=np.zeros_like(numerator), where=denominator > 0) * 100
+    return np.where(denominator > 0, pct, default)
+
+
+def rating_features(match_df):
+    """Every input a profile can weight, as float arrays aligned to match_df."""
+    columns = {}
+
+    def stat(col):
+        if col not in columns:  # several features share a column
+            columns[col] = stat_values(match_df, col)
+        return columns[col]
+
+    minutes = stat("Minutes played")
+    factor = 90.0 / np.maximum(minutes, 1)
+    shots_against = stat("Shots against")
+    f = {
+        "minutes": minutes,
+        "shots_against": shots_against,
+        "goals_prevented": stat("xCG") - stat("Conceded goals"),
+        "yellow_cards": stat("Yellow cards"),
+        "red_cards": stat("Red cards"),
+    }
+    per_90 = {
+        "goals_p90": "Goals", "assists_p90": "Assists", "xg_p90": "xG", "xa_p90": "xA",
+        "shot_assists_p90": "Shot assists", "interceptions_p90": "Interceptions",
+        "recoveries_p90": "Recoveries", "clearances_p90": "Clearances",
+        "progressive_runs_p90": "Progressive runs", "touches_box_p90": "Touches in penalty area",
+        "losses_p90": "Losses", "exits_p90": "Exits", "crosses_p90": "Crosses", "shots_p90": "Shots",
+        "dribbles_successful_p90": "Dribbles_successful",
+    }
+    for name, col in per_90.items():
+        f[name] = stat(col) * factor
+    # Success rates as 0-1 fractions; the default applies where there were no attempts
+    rates = {
+        "duel_rate": ("Duels_won", "Duels", 50), "pass_rate": ("Passes_accurate", "Passes", 50),
+        "aerial_rate": ("Aerial duels_won", "Aerial duels", 50),
+        "dribble_rate": ("Dribbles_successful", "Dribbles", 50),
+        "cross_rate": ("Crosses_accurate", "Crosses", 50), "shot_accuracy_rate": ("Shots_on target", "Shots", 50),
+        "action_rate": ("Total actions_successful", "Total actions", 50),
+        "save_rate": ("Saves", "Shots against", 70),
+    }
+    for name, (won, attempts, default) in rates.items():
+        f[name] = pct_values(stat(won), stat(attempts), default) / 100
+    return f
+
+
+FEATURES = sorted(rating_features(pd.DataFrame({"Minutes played": [90]})))
+
+
+# ─────────────────────────────────────────────
+# COMPILER
+# ─────────────────────────────────────────────
+def _number(value, where):
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise ProfileError(f"{where}: expected a number, got {value!r}")
+    return repr(float(value))
+
+
+def _feature(name, where):
+    if name not in FEATURES:
+        raise ProfileError(f"{where}: unknown feature {name!r} (known: {', '.join(FEATURES)})")
+    return f"f[{name!r}]"
+
+
+def _weighted_sum(weights, where):
+    """Source for f[a] * wa + f[b] * wb + ... in declaration order."""
+    if not weights:
+        raise ProfileError(f"{where}: no features")
+    return " + ".join(f"{_feature(n, where)} * {_number(w, where)}" for n, w in weights.items())
+
+
+def _term_source(term, where):
+    if "features" in term:
+        expr = _weighted_sum(term["features"], where)
+    elif "sum" in term:
+        if not term["sum"]:
+            raise ProfileError(f"{where}: no features")
+        expr = f"({' + '.join(_feature(n, where) for n in term['sum'])}) * {_number(term.get('weight', 1.0), where)}"
+    else:
+        raise ProfileError(f"{where}: needs 'features' or 'sum'")
+    if "min" in term:
+        expr = f"np.maximum({expr}, {_number(term['min'], where)})"
+    if "max" in term:
+        expr = f"np.minimum({expr}, {_number(term['max'], where)})"
+    if "only_if" in term:
+        expr = (f"np.where({_feature(term['only_if'], where)} > 0, {expr}, "
+                f"{_number(term.get('otherwise', 0.0), where)})")
+    return expr
+
+
+def profile_source(name, profile):
+    """The Python source of a profile's rating function, one numpy expression per group."""
+    groups = profile.get("groups", {})
+    missing = [g for g in POSITION_GROUPS if g not in groups]
+    if missing:
+        raise ProfileError(f"profile {name!r}: no weights for group(s) {', '.join(missing)}")
+
+    lines = ["def rate(f, groups):"]
+    for group in POSITION_GROUPS:
+        spec = groups[group]
+        expr = _number(spec.get("base", 0.0), f"{name}.{group}.base")
+        for i, term in enumerate(spec.get("terms", [])):
+            where = f"{name}.{group}.{term.get('name', i)}"
+            expr += f"\n        {'-' if term.get('subtract') else '+'} {_term_source(term, where)}"
+        lines.append(f"    {group} = ({expr})")
+
+    conditions = ", ".join(f"groups == {g!r}" for g in POSITION_GROUPS[:-1])
+    lines.append(f"    score = np.select([{conditions}], [{', '.join(POSITION_GROUPS[:-1])}], default=outfield)")
+    if profile.get("discipline"):
+        lines.append(f"    score = score - ({_weighted_sum(profile['discipline'], f'{name}.discipline')})")
+    low, high = profile.get("scale", [1.0, 10.0])
+    lines.append(f"    score = np.maximum({_number(low, name)}, np.minimum({_number(high, name)}, score))")
+    if profile.get("regress_below_minutes"):
+        below = _number(profile["regress_below_minutes"], f"{name}.regress_below_minutes")
+        toward = _number(profile.get("regress_to", 5.0), f"{name}.regress_to")
+        lines.append(f"    weight = f['minutes'] / {below}")
+        lines.append(f"    score = np.where(f['minutes'] < {below}, score * weight + {toward} * (1 - weight), score)")
+    lines.append("    return score")
+    return "\n".join(lines) + "\n"
+
+
+def compile_profile(name, profile):
+    """
+    Turn a profile into a CompiledProfile whose evaluate(features, groups)
+    returns the ratings (NaN = not rated) for rating_features() and
+    position_groups() output.
+    """
+    source = profile_source(name, profile)
+    namespace = {"np": np}
+    exec(compile(source, f"<rating profile {name}>", "exec"), namespace)
+    rate = namespace["rate"]
+    min_minutes = float(profile.get("min_minutes", 10))
+
+    def evaluate(features, groups):
+        score = rate(features, groups)
+        # Python's round() so results match the scalar function exactly
+        return [round(s, 1) if m >= min_minutes else np.nan
+                for s, m in zip(score.tolist(), features["minutes"].tolist())]
+
+    return CompiledProfile(name, source, evaluate)
+
+
+def load_profiles(path=PROFILES_FILE):
+    """Every profile in the config file, compiled: name -> CompiledProfile."""
+    with open(path, encoding="utf-8") as fh:
+        profiles = json.load(fh)
+    return {name: compile_profile(name, spec) for name, spec in profiles.items() if not name.startswith("_")}
+
+
+# ─────────────────────────────────────────────
+# A/B COMPARISON
+# ─────────────────────────────────────────────
+def rate_profiles(match_df, groups, compiled):
+    """One rating column per compiled profile, all from a single pass over the features."""
+    features = rating_features(match_df)
+    return pd.DataFrame({p.name: p.evaluate(features, groups) for p in compiled},
+                        index=match_df.index, dtype=float)
+
+
+def compare_ratings(match_df, ratings, a, b):
+    """Per-player summary of profile b against profile a, biggest average change first."""
+    diff = ratings[b] - ratings[a]
+    summary = pd.DataFrame({
+        "Player": match_df["Player"].astype(str), a: ratings[a], b: ratings[b],
+        "change": diff, "changed": diff.abs() > 0,
+    }).groupby("Player").agg(
+        rated=(a, "count"), **{a: (a, "mean"), b: (b, "mean")},
+        mean_change=("change", "mean"), max_change=("change", lambda d: d.abs().max()), rows_changed=("changed", "sum"),
+    )
+    return summary.sort_values("mean_change", key=abs, ascending=False).round(2)
+
+
+if __name__ == "__main__":
+    import time
+
+    import core
+
+    names = sys.argv[1:] or ["default"]
+    available = load_profiles(core.RATING_PROFILES_FILE)
+    unknown = [n for n in names if n not in available]
+    if unknown:
+        sys.exit(f"unknown profile(s) {', '.join(unknown)}; available: {', '.join(available)}")
+    matches = core.load_match_data()
+    start = time.perf_counter()
+    ratings = rate_profiles(matches, core.position_groups(matches["Position"]), [available[n] for n in names])
+    print(f"rated {len(matches)} rows with {len(names)} profile(s) in {time.perf_counter() - start:.3f}s")
+    if len(names) == 1:
+        print(available[names[0]].source)
+    else:
+        for other in names[1:]:
+            print(f"\n{other} vs {names[0]}")
+            print(compare_ratings(matches, ratings, names[0], other).to_string())
@@ -0,0 +1,398 @@
+"""
+Theme layer for the dashboard: the CSS block, sidebar brand and page header
+of each branded variant. Data, ratings and page layout are shared (core.py,
+dashboard.py); a theme only changes how the page looks.
+"""
+import os
+from collections import namedtuple
+from string import Template
+
+Theme = namedtuple("Theme", ["name", "css", "sidebar_brand", "header"])
+
+# ─────────────────────────────────────────────
+# CSS
+# ─────────────────────────────────────────────
+# Black dashboard with a single accent colour (gold for Beswicks, neon green for the alt brand)
+_ACCENT_CSS = Template("""<style>
+    @import url('https://fonts.googleapis.com/css2?family=Outfit:wght@300;400;500;600;700&family=Inter:wght@300;400;500;600&display=swap');
+
+    /* ── Global ── */
+    .stApp {
+        background-color: #0a0a0a;
+        color: #e8e8e8;
+        font-family: 'Inter', sans-serif;
+    }
+
+    /* ── Sidebar ── */
+    [data-testid="stSidebar"] {
+        background-color: #111111;
+        border-right: 1px solid #222222;
+    }
+    [data-testid="stSidebar"] .stMarkdown h1,
+    [data-testid="stSidebar"] .stMarkdown h2,
+    [data-testid="stSidebar"] .stMarkdown h3 {
+        color: $accent;
+    }
+    [data-testid="stSidebar"] .stMarkdown p,
+    [data-testid="stSidebar"] .stMarkdown li {
+        color: #999999;
+    }
+    [data-testid="stSidebar"] .stMarkdown strong {
+        color: #e8e8e8;
+    }
+
+    /* ── Headers ── */
+    h1, h2, h3 {
+        font-family: 'Outfit', sans-serif !important;
+        color: #ffffff !important;
+        font-weight: 600 !important;
+        letter-spacing: -0.02em;
+    }
+
+    /* ── Metric Cards ── */
+    [data-testid="stMetric"] {
+        background: #141414;
+        border: 1px solid #222222;
+        border-radius: 8px;
+        padding: 16px 20px;
+    }
+    [data-testid="stMetric"] label {
+        color: #777777 !important;
+        font-size: 0.75rem !important;
+        text-transform: uppercase;
+        letter-spacing: 0.08em;
+        font-family: 'Inter', sans-serif !important;
+    }
+    [data-testid="stMetric"] [data-testid="stMetricValue"] {
+        color: $accent !important;
+        font-family: 'Outfit', sans-serif !important;
+        font-weight: 600 !important;
+        font-size: 1.8rem !important;
+    }
+
+    /* ── Tabs ── */
+    .stTabs [data-baseweb="tab-list"] {
+        gap: 0px;
+        background-color: #141414;
+        border-radius: 8px;
+        padding: 4px;
+        border: 1px solid #222222;
+    }
+    .stTabs [data-baseweb="tab"] {
+        color: #777777;
+        border-radius: 6px;
+        font-family: 'Outfit', sans-serif;
+        font-size: 0.85rem;
+        font-weight: 500;
+    }
+    .stTabs [aria-selected="true"] {
+        background-color: $accent !important;
+        color: #0a0a0a !important;
+        font-weight: 600 !important;
+    }
+
+    /* ── Selectbox ── */
+    .stSelectbox label {
+        color: #777777 !important;
+        text-transform: uppercase;
+        font-size: 0.75rem !important;
+        letter-spacing: 0.08em;
+    }
+
+    /* ── Dividers ── */
+    hr {
+        border-color: #222222 !important;
+    }
+
+    /* ── Hide Streamlit chrome ── */
+    #MainMenu {visibility: hidden;}
+    footer {visibility: hidden;}
+    header {visibility: hidden;}
+
+    /* ── Badges ── */
+    .position-badge {
+        display: inline-block;
+        background: #1a1a1a;
+        color: $accent;
+        padding: 3px 12px;
+        border-radius: 4px;
+        font-size: 0.75rem;
+        font-family: 'Outfit', sans-serif;
+        font-weight: 500;
+        border: 1px solid #2a2a2a;
+        letter-spacing: 0.03em;
+    }
+    .club-badge {
+        display: inline-block;
+        background: #141414;
+        color: #cccccc;
+        padding: 3px 12px;
+        border-radius: 4px;
+        font-size: 0.75rem;
+        font-family: 'Inter', sans-serif;
+        border: 1px solid #222222;
+    }
+
+    /* ── Logo ── */
+    .logo-container {
+        text-align: center;
+        padding: 10px 0 20px 0;
+    }
+    .logo-container img {
+        max-width: 180px;
+        filter: brightness(0) invert(1);
+    }
+
+    /* ── Rating colours ── */
+    .rating-excellent { background-color: #1a5c2a; color: #ffffff; padding: 4px 10px; border-radius: 4px; font-weight: 600; text-align: center; font-family: 'Outfit', sans-serif; font-size: 0.85rem; }
+    .rating-good { background-color: #1e7a3a; color: #ffffff; padding: 4px 10px; border-radius: 4px; font-weight: 600; text-align: center; font-family: 'Outfit', sans-serif; font-size: 0.85rem; }
+    .rating-average { background-color: #8a6d1b; color: #ffffff; padding: 4px 10px; border-radius: 4px; font-weight: 600; text-align: center; font-family: 'Outfit', sans-serif; font-size: 0.85rem; }
+    .rating-belowavg { background-color: #9a3412; color: #ffffff; padding: 4px 10px; border-radius: 4px; font-weight: 600; text-align: center; font-family: 'Outfit', sans-serif; font-size: 0.85rem; }
+    .rating-poor { background-color: #7f1d1d; color: #ffffff; padding: 4px 10px; border-radius: 4px; font-weight: 600; text-align: center; font-family: 'Outfit', sans-serif; font-size: 0.85rem; }
+    .rating-minimal { background-color: #262626; color: #666666; padding: 4px 10px; border-radius: 4px; font-weight: 600; text-align: center; font-family: 'Outfit', sans-serif; font-size: 0.85rem; }
+
+    /* ── Game Log Table ── */
+    .game-log-table {
+        width: 100%;
+        border-collapse: collapse;
+        font-family: 'Inter', sans-serif;
+        font-size: 0.82rem;
+    }
+    .game-log-table th {
+        background-color: #141414;
+        color: $accent;
+        padding: 12px 12px;
+        text-align: left;
+        font-family: 'Outfit', sans-serif;
+        font-size: 0.72rem;
+        font-weight: 600;
+        text-transform: uppercase;
+        letter-spacing: 0.08em;
+        border-bottom: 2px solid $accent;
+    }
+    .game-log-table td {
+        padding: 10px 12px;
+        border-bottom: 1px solid #1a1a1a;
+        color: #cccccc;
+    }
+    .game-log-table tr:hover {
+        background-color: #141414;
+    }
+    .game-log-table .match-col {
+        max-width: 280px;
+        white-space: nowrap;
+        overflow: hidden;
+        text-overflow: ellipsis;
+    }
+    .game-log-table .num-col {
+        text-align: center;
+        min-width: 40px;
+    }
+    .game-log-table .rating-col {
+        text-align: center;
+        min-width: 70px;
+    }
+</style>
+""")
+
+_ORANGE_CSS = """<style>
+    @import url('https://fonts.googleapis.com/css2?family=DM+Sans:wght@400;500;700&family=Space+Mono:wght@400;700&display=swap');
+
+    .stApp {
+        background-color: #0a0e17;
+        color: #e0e4ec;
+        font-family: 'DM Sans', sans-serif;
+    }
+
+    [data-testid="stSidebar"] {
+        background-color: #101828;
+        border-right: 1px solid #1e2a3a;
+    }
+    [data-testid="stSidebar"] .stMarkdown h1,
+    [data-testid="stSidebar"] .stMarkdown h2,
+    [data-testid="stSidebar"] .stMarkdown h3 {
+        color: #f97316;
+    }
+
+    h1, h2, h3 {
+        font-family: 'Space Mono', monospace !important;
+        color: #ffffff !important;
+    }
+
+    [data-testid="stMetric"] {
+        background: linear-gradient(135deg, #141c2e 0%, #1a2540 100%);
+        border: 1px solid #1e2a3a;
+        border-radius: 12px;
+        padding: 16px 20px;
+    }
+    [data-testid="stMetric"] label {
+        color: #8896ab !important;
+        font-size: 0.8rem !important;
+        text-transform: uppercase;
+        letter-spacing: 0.05em;
+    }
+    [data-testid="stMetric"] [data-testid="stMetricValue"] {
+        color: #f97316 !important;
+        font-family: 'Space Mono', monospace !important;
+        font-size: 1.8rem !important;
+    }
+
+    .stTabs [data-baseweb="tab-list"] {
+        gap: 0px;
+        background-color: #101828;
+        border-radius: 12px;
+        padding: 4px;
+    }
+    .stTabs [data-baseweb="tab"] {
+        color: #8896ab;
+        border-radius: 8px;
+        font-family: 'Space Mono', monospace;
+        font-size: 0.85rem;
+    }
+    .stTabs [aria-selected="true"] {
+        background-color: #f97316 !important;
+        color: #0a0e17 !important;
+    }
+
+    .stSelectbox label {
+        color: #8896ab !important;
+        text-transform: uppercase;
+        font-size: 0.8rem !important;
+        letter-spacing: 0.05em;
+    }
+
+    hr {
+        border-color: #1e2a3a !important;
+    }
+
+    #MainMenu {visibility: hidden;}
+    footer {visibility: hidden;}
+    header {visibility: hidden;}
+
+    .position-badge {
+        display: inline-block;
+        background: #1e2a3a;
+        color: #f97316;
+        padding: 2px 10px;
+        border-radius: 20px;
+        font-size: 0.75rem;
+        font-family: 'Space Mono', monospace;
+        border: 1px solid #2a3a50;
+    }
+    .club-badge {
+        display: inline-block;
+        background: #141c2e;
+        color: #e0e4ec;
+        padding: 2px 10px;
+        border-radius: 20px;
+        font-size: 0.75rem;
+        font-family: 'DM Sans', sans-serif;
+        border: 1px solid #1e2a3a;
+    }
+
+    /* Rating colours */
+    .rating-excellent { background-color: #166534; color: #ffffff; padding: 4px 10px; border-radius: 8px; font-weight: 700; text-align: center; }
+    .rating-good { background-color: #15803d; color: #ffffff; padding: 4px 10px; border-radius: 8px; font-weight: 700; text-align: center; }
+    .rating-average { background-color: #a16207; color: #ffffff; padding: 4px 10px; border-radius: 8px; font-weight: 700; text-align: center; }
+    .rating-belowavg { background-color: #c2410c; color: #ffffff; padding: 4px 10px; border-radius: 8px; font-weight: 700; text-align: center; }
+    .rating-poor { background-color: #991b1b; color: #ffffff; padding: 4px 10px; border-radius: 8px; font-weight: 700; text-align: center; }
+    .rating-minimal { background-color: #374151; color: #9ca3af; padding: 4px 10px; border-radius: 8px; font-weight: 700; text-align: center; }
+
+    /* Game log table */
+    .game-log-table {
+        width: 100%;
+        border-collapse: collapse;
+        font-family: 'DM Sans', sans-serif;
+        font-size: 0.85rem;
+    }
+    .game-log-table th {
+        background-color: #1a2540;
+        color: #f97316;
+        padding: 10px 12px;
+        text-align: left;
+        font-family: 'Space Mono', monospace;
+        font-size: 0.75rem;
+        text-transform: uppercase;
+        letter-spacing: 0.05em;
+        border-bottom: 2px solid #2a3a50;
+    }
+    .game-log-table td {
+        padding: 10px 12px;
+        border-bottom: 1px solid #1e2a3a;
+        color: #e0e4ec;
+    }
+    .game-log-table tr:hover {
+        background-color: #141c2e;
+    }
+    .game-log-table .match-col {
+        max-width: 280px;
+        white-space: nowrap;
+        overflow: hidden;
+        text-overflow: ellipsis;
+    }
+    .game-log-table .num-col {
+        text-align: center;
+        min-width: 40px;
+    }
+    .game-log-table .rating-col {
+        text-align: center;
+        min-width: 70px;
+    }
+</style>
+"""
+
+_LOGO_IMG = """
+    <div class="logo-container">
+        <img src="https://beswickssports.com/wp-content/uploads/2024/06/beswickssports.svg" alt="Beswicks Sports">
+    </div>
+    """
+
+_WORDMARK = """
+    <div style="text-align: center; padding: 10px 0 20px 0;">
+        <span style="font-family: 'Outfit', sans-serif; font-size: 1.6rem; font-weight: 800; color: #ffffff; letter-spacing: 0.02em;">BESWICKS</span><span style="font-family: 'Outfit', sans-serif; font-size: 1.6rem; font-weight: 800; font-style: italic; color: #b8ff00; letter-spacing: 0.02em;">SPORTS</span>
+    </div>
+    """
+
+# ─────────────────────────────────────────────
+# THEMES
+# ─────────────────────────────────────────────
+THEMES = {
+    "beswicks": Theme(
+        name="beswicks",
+        css=_ACCENT_CSS.substitute(accent="#c9a84c"),
+        sidebar_brand=_LOGO_IMG,
+        header=[
+            "# BESWICKS SPORTS",
+            '<p style="color: #c9a84c; font-family: Outfit, sans-serif; font-size: 1.1rem; font-weight: 300; margin-top: -10px;">Client Performance Dashboard</p>',
+        ],
+    ),
+    "orange": Theme(
+        name="orange",
+        css=_ORANGE_CSS,
+        sidebar_brand="# ⚽ BESWICKS",
+        header=["# ⚽ BESWICKS SPORTS", "### Client Performance Dashboard"],
+    ),
+    "neon": Theme(
+        name="neon",
+        css=_ACCENT_CSS.substitute(accent="#b8ff00"),
+        sidebar_brand=_WORDMARK,
+        header=[
+            '<div style="margin-bottom: -5px;"><span style="font-family: Outfit, sans-serif; font-size: 2.2rem; font-weight: 800; color: #ffffff;">BESWICKS</span><span style="font-family: Outfit, sans-serif; font-size: 2.2rem; font-weight: 800; font-style: italic; color: #b8ff00;">SPORTS</span></div>',
+            '<p style="color: #777777; font-family: Inter, sans-serif; font-size: 1rem; font-weight: 300;">Client Performance Dashboard</p>',
+        ],
+    ),
+}
+DEFAULT_THEME = "beswicks"
+# Server-wide override of every entry script's own theme; ?theme=<name> still wins per page
+SERVER_THEME = os.environ.get("DASHBOARD_THEME")
+
+
+def resolve_theme(requested, default=DEFAULT_THEME):
+    """
+    The theme named by requested (case-insensitive), else by SERVER_THEME,
+    else default, else the Beswicks theme.
+    """
+    for name in (requested, SERVER_THEME, default):
+        if name and str(name).strip().lower() in THEMES:
+            return THEMES[str(name).strip().lower()]
+    return THEMES["beswicks"]
@@ -0,0 +1,49 @@
+"""
+Prebuild every on-disk cache the dashboard starts from, so the first visitor
+after a deploy does not pay for parsing the exports and rating every match.
+Run it from the app folder in the container build or as a pre-start hook:
+
+    python warmup.py [--rebuild]
+
+It writes the per-file Parquet conversions, the combined match frame and
+its manifest, and the prepared (rated, sorted, compacted) match frame to
+.xlsx_cache/. The app reuses them as long as the exports, the rating
+profiles, the parsing/rating/layout code (core.PREPARED_CODE_MODULES) and
+the layout settings are unchanged.
+"""
+import argparse
+import os
+import shutil
+import time
+
+import core
+
+
+def warm_up(rebuild=False):
+    """Run the dashboard's load once and return (stage, seconds) timings."""
+    if rebuild:
+        shutil.rmtree(core.CACHE_DIR, ignore_errors=True)
+    timings = []
+    start = time.perf_counter()
+    season = core.load_season_data()
+    timings.append(("season overview", time.perf_counter() - start))
+
+    start = time.perf_counter()
+    matches, rating_gaps, _ = core.load_prepared_match_data()
+    timings.append(("match exports, ratings and layout", time.perf_counter() - start))
+
+    print(f"{len(season)} clients, {len(matches)} match rows from {len(core.match_files())} exports")
+    for player, missing in rating_gaps.items():
+        print(f"warning: {player}: export has no {', '.join(missing)} column(s)")
+    return timings
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Prebuild the dashboard's data caches.")
+    parser.add_argument("--rebuild", action="store_true", help="discard existing caches and build from the xlsx files")
+    args = parser.parse_args()
+
+    for stage, seconds in warm_up(args.rebuild):
+        print(f"{stage}: {seconds:.2f}s")
+    for name in sorted(os.listdir(core.CACHE_DIR)):
+        print(f"  {os.path.join(core.CACHE_DIR, name)}")
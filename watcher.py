@@ -0,0 +1,67 @@
+"""
+Background refresh of the dashboard data when the source files change.
+
+The app keeps one DataWatcher per server process (via st.cache_resource).
+Readers always get the last complete snapshot; reloads run on a daemon thread
+and replace the snapshot in a single reference swap, so no rerun ever waits
+on a reload.
+"""
+import threading
+import time
+
+
+class DataWatcher:
+    """
+    Poll fingerprint() every interval seconds and rebuild the snapshot with
+    load() when it changes. load() returns the whole dataset (any object);
+    fingerprint() returns a cheap comparable summary of the source files.
+    """
+
+    def __init__(self, load, fingerprint, interval=30.0):
+        self._load = load
+        self._fingerprint = fingerprint
+        self.interval = interval
+        self.version = 0
+        self.last_error = None
+        self.last_refresh = None
+
+        # First load is synchronous: there is nothing to serve before it
+        self._seen = fingerprint()
+        self._snapshot = load()
+        self.last_refresh = time.time()
+
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="data-watcher", daemon=True)
+        self._thread.start()
+
+    def snapshot(self):
+        """The current dataset; never blocks on a reload in progress."""
+        return self._snapshot
+
+    def check_now(self):
+        """Reload if the files changed since the last load. Returns True if the snapshot was replaced."""
+        current = self._fingerprint()
+        if current == self._seen:
+            return False
+        try:
+            data = self._load()
+        except Exception as exc:  # keep serving the previous snapshot
+            self.last_error = exc
+            return False
+        # Fingerprint taken before loading: edits made during the load are seen on the next poll
+        self._seen = current
+        self._snapshot = data
+        self.version += 1
+        self.last_error = None
+        self.last_refresh = time.time()
+        return True
+
+    def stop(self):
+        self._stop.set()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.check_now()
+            except Exception as exc:  # e.g. a file vanished between glob and stat
+                self.last_error = exc